@@ -0,0 +1,300 @@
+import pygame
+from Code.Utilities.settings import *
+from Code.Entities.bullet import aim_bullet
+from Code.Entities.Explosion import Explosion
+from Code.Functions.support import get_bullet_image
+
+try:
+    import numpy as np
+except ImportError:  # the engine is optional, Level falls back to sprite bullets
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+
+class BulletImage:
+    """
+    Minimal drawable of a bullet inside the camera: just what YSortCameraGroup needs.
+    """
+
+    __slots__ = ('image', 'rect')
+    sprite_type = 'bullet'
+
+    def __init__(self, image, rect):
+        self.image = image
+        self.rect = rect
+
+
+class BulletView:
+    """
+    Sprite-like view of one bullet stored in a BulletEngine. Views are only created
+    for bullets that reach the narrow phase or are inside the camera.
+    """
+
+    sprite_type = 'bullet'
+
+    def __init__(self, engine, index):
+        """
+        Builds the view of the bullet stored at the given slot.
+
+        Args:
+            engine (BulletEngine): Engine that owns the bullet.
+            index (int): Slot of the bullet in the engine arrays.
+        """
+
+        self.engine = engine
+        self.index = index
+        self.image = engine.image
+
+        width, height = engine.size
+        x, y = engine.pos[index]
+        prev_x, prev_y = engine.prev_pos[index]
+        self.rect = pygame.Rect(int(x), int(y), width, height)
+        self.previous_rect = pygame.Rect(int(prev_x), int(prev_y), width, height)
+        self.swept_rect = self.previous_rect.union(self.rect)
+        self.direction = pygame.math.Vector2(engine.direction[index].tolist())
+        self.origin_layer = int(engine.origin_layer[index])
+        self.collision_mask = int(engine.collision_mask[index])
+
+    def start_sweep(self):
+        """
+        Kept for the Bullet interface: the engine restarts every sweep in step().
+        """
+
+    def move_to_contact(self, distance):
+        """
+        Places the bullet where it first touched a target during the last step.
+
+        Args:
+            distance (int): Pixels travelled from the start of the step.
+        """
+
+        self.rect.topleft = (
+            self.previous_rect.x + self.direction.x * distance,
+            self.previous_rect.y + self.direction.y * distance,
+        )
+
+    def explode_and_kill(self):
+        """
+        Creates an explosion effect and removes the bullet from the engine.
+        """
+
+        if self.engine.all_sprites_group:
+            Explosion(self.rect.center, [self.engine.all_sprites_group])
+        self.engine.kill(self.index)
+
+
+class BulletEngine:
+    """
+    Structure-of-arrays bullet system: positions, directions, speeds, owner layers and
+    remaining range live in NumPy arrays, move in one vectorized step and are tested in
+    bulk against an occupancy grid of the attackable sprites. Only the bullets whose
+    path touches an occupied cell go through the level's narrow phase.
+    """
+
+    def __init__(self, attackable_sprites, all_sprites_group=None, capacity=BULLET_ENGINE_CAPACITY):
+        """
+        Initializes the engine arrays.
+
+        Args:
+            attackable_sprites (SpatialGroup): Attackable sprites, used to build the occupancy grid.
+            all_sprites_group: Optional group for the explosion effect.
+            capacity (int): Initial number of bullet slots, grown when full.
+        """
+
+        self.attackable_sprites = attackable_sprites
+        self.all_sprites_group = all_sprites_group
+
+        self.image = get_bullet_image()
+        self.size = self.image.get_size()
+        self.world_rect = pygame.Rect(WORLD_RECT)
+
+        self.count = 0
+        self.allocate(capacity)
+
+        # Occupancy grid: layer bits of the static attackable sprites per tile,
+        # rebuilt when the attackable group changes
+        self.static_layers = np.zeros((MAP_ROWS, MAP_COLS), dtype=np.uint8)
+        self.static_version = None
+
+        # Reused by fire() to aim new bullets without allocating
+        self.aim_rect = pygame.Rect((0, 0), self.size)
+        self.aim_direction = pygame.math.Vector2()
+
+    def __len__(self):
+        return self.count
+
+    def allocate(self, capacity):
+        """
+        (Re)allocates the arrays, keeping the live bullets.
+
+        Args:
+            capacity (int): New number of slots.
+        """
+
+        old = getattr(self, 'pos', None)
+        arrays = {
+            'pos': np.zeros((capacity, 2), dtype=np.float64),
+            'prev_pos': np.zeros((capacity, 2), dtype=np.float64),
+            'direction': np.zeros((capacity, 2), dtype=np.float64),
+            'speed': np.zeros(capacity, dtype=np.float64),
+            'range_left': np.zeros(capacity, dtype=np.float64),
+            'origin_layer': np.zeros(capacity, dtype=np.uint8),
+            'collision_mask': np.zeros(capacity, dtype=np.uint8),
+            'alive': np.zeros(capacity, dtype=bool),
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def fire(self, entity, bullet_speed):
+        """
+        Adds a bullet in front of the entity firing it.
+
+        Args:
+            entity: The entity firing the bullet.
+            bullet_speed (float): Speed of the bullet.
+        """
+
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        aim_bullet(entity, self.aim_rect, self.aim_direction)
+        index = self.count
+        self.pos[index] = self.aim_rect.topleft
+        self.prev_pos[index] = self.aim_rect.topleft
+        self.direction[index] = (self.aim_direction.x, self.aim_direction.y)
+        self.speed[index] = bullet_speed
+        self.range_left[index] = BULLET_MAX_RANGE
+        self.origin_layer[index] = COLLISION_LAYERS.get(entity.sprite_type, 0)
+        self.collision_mask[index] = BULLET_MASKS.get(entity.sprite_type, 0)
+        self.alive[index] = True
+        self.count += 1
+
+    def kill(self, index):
+        """
+        Marks a bullet as dead; its slot is reclaimed at the end of the step.
+
+        Args:
+            index (int): Slot of the bullet.
+        """
+
+        self.alive[index] = False
+
+    def get_occupancy(self):
+        """
+        Returns the layer bits of every tile, including the cells under the moving tanks.
+
+        Returns:
+            numpy.ndarray: (MAP_ROWS, MAP_COLS) array of layer bits.
+        """
+
+        group = self.attackable_sprites
+        group.refresh()
+        index = group.index
+
+        if self.static_version != group.version:
+            self.static_layers.fill(0)
+            for sprite, (first_x, first_y, last_x, last_y) in index.item_cells.items():
+                if sprite not in group.mobile_sprites:
+                    self.static_layers[max(first_y, 0):last_y + 1, max(first_x, 0):last_x + 1] |= sprite.collision_layer
+            self.static_version = group.version
+
+        occupancy = self.static_layers.copy()
+        for sprite in group.mobile_sprites:
+            first_x, first_y, last_x, last_y = index.item_cells[sprite]
+            occupancy[max(first_y, 0):last_y + 1, max(first_x, 0):last_x + 1] |= sprite.collision_layer
+        return occupancy
+
+    def step(self, steps, resolve):
+        """
+        Advances every bullet, resolves the ones whose path touches an occupied cell
+        and removes the dead and out of range or out of world bullets.
+
+        Args:
+            steps (int): Number of movement steps to advance.
+            resolve (callable): Narrow phase, receives a BulletView and returns True on a hit.
+
+        Returns:
+            int: Number of bullets that hit something.
+        """
+
+        count = self.count
+        if not count:
+            return 0
+
+        pos = self.pos[:count]
+        prev_pos = self.prev_pos[:count]
+        prev_pos[:] = pos
+        travel = self.speed[:count] * steps
+        pos += self.direction[:count] * travel[:, None]
+        self.range_left[:count] -= travel
+
+        # Cells covered by the swept rect of every bullet
+        width, height = self.size
+        left = np.minimum(prev_pos[:, 0], pos[:, 0]).astype(np.int64)
+        top = np.minimum(prev_pos[:, 1], pos[:, 1]).astype(np.int64)
+        right = np.maximum(prev_pos[:, 0], pos[:, 0]).astype(np.int64) + width
+        bottom = np.maximum(prev_pos[:, 1], pos[:, 1]).astype(np.int64) + height
+
+        first_x = np.clip(left // TILESIZE, 0, MAP_COLS - 1)
+        first_y = np.clip(top // TILESIZE, 0, MAP_ROWS - 1)
+        last_x = np.clip((right - 1) // TILESIZE, 0, MAP_COLS - 1)
+        last_y = np.clip((bottom - 1) // TILESIZE, 0, MAP_ROWS - 1)
+
+        # Bulk broad phase: any covered cell holding a layer in the bullet's mask
+        occupancy = self.get_occupancy()
+        mask = self.collision_mask[:count]
+        touched = np.zeros(count, dtype=bool)
+        for dy in range(int((last_y - first_y).max()) + 1):
+            cell_y = np.minimum(first_y + dy, last_y)
+            for dx in range(int((last_x - first_x).max()) + 1):
+                cell_x = np.minimum(first_x + dx, last_x)
+                touched |= (occupancy[cell_y, cell_x] & mask) != 0
+
+        hits = 0
+        for index in np.flatnonzero(touched & self.alive[:count]):
+            if resolve(BulletView(self, index)):
+                hits += 1
+
+        # Cull bullets out of range or outside the world, then compact the arrays
+        world = self.world_rect
+        inside = (right > world.left) & (left < world.right) & (bottom > world.top) & (top < world.bottom)
+        keep = self.alive[:count] & inside & (self.range_left[:count] >= 0)
+        survivors = int(keep.sum())
+        if survivors != count:
+            for name in ('pos', 'prev_pos', 'direction', 'speed', 'range_left', 'origin_layer', 'collision_mask', 'alive'):
+                array = getattr(self, name)
+                array[:survivors] = array[:count][keep]
+            self.count = survivors
+
+        return hits
+
+    def get_visible_views(self, camera_world_rect):
+        """
+        Returns drawables for the bullets inside the camera, sorted by centery.
+
+        Args:
+            camera_world_rect (pygame.Rect): Camera rectangle in world coordinates.
+
+        Returns:
+            list: BulletImage objects to draw.
+        """
+
+        count = self.count
+        if not count:
+            return []
+
+        width, height = self.size
+        pos = self.pos[:count].astype(np.int64)
+        visible = np.flatnonzero(
+            (pos[:, 0] + width > camera_world_rect.left) & (pos[:, 0] < camera_world_rect.right) &
+            (pos[:, 1] + height > camera_world_rect.top) & (pos[:, 1] < camera_world_rect.bottom)
+        )
+        visible = visible[np.argsort(pos[visible, 1], kind='stable')]
+
+        image = self.image
+        Rect = pygame.Rect
+        return [BulletImage(image, Rect(x, y, width, height)) for x, y in pos[visible].tolist()]
@@ -0,0 +1,70 @@
+from Code.Entities.bullet import Bullet
+
+class BulletPool:
+    """
+    Recycles Bullet instances: killed bullets return to the pool and are reset
+    the next time one is fired, so firing does not allocate surfaces or load images.
+    """
+
+    def __init__(self, tile_sprites, groups, all_sprites_group=None):
+        """
+        Initializes an empty pool.
+
+        Args:
+            tile_sprites: Group of tile sprites passed to every bullet.
+            groups (list): Sprite groups a fired bullet joins.
+            all_sprites_group: Optional group for the explosion effect.
+        """
+
+        self.tile_sprites = tile_sprites
+        self.groups = groups
+        self.all_sprites_group = all_sprites_group
+        self.free_bullets = []
+        self.created = 0
+        self.reused = 0
+
+    def prefill(self, entity, amount):
+        """
+        Creates bullets up front so the first shots of a match are recycled too.
+
+        Args:
+            entity: Any entity with sprite_type, status and rect, used as a placeholder origin.
+            amount (int): Number of bullets to create.
+        """
+
+        for _ in range(amount):
+            bullet = Bullet(entity, self.tile_sprites, [], 0, self.all_sprites_group, pool=self)
+            self.free_bullets.append(bullet)
+            self.created += 1
+
+    def acquire(self, entity, bullet_speed):
+        """
+        Fires a bullet from the given entity, reusing a free bullet when there is one.
+
+        Args:
+            entity: The entity firing the bullet.
+            bullet_speed (float): Speed of the bullet.
+
+        Returns:
+            Bullet: The bullet that was fired.
+        """
+
+        if self.free_bullets:
+            bullet = self.free_bullets.pop()
+            bullet.reset(entity, self.tile_sprites, bullet_speed, self.all_sprites_group)
+            bullet.add(self.groups)
+            self.reused += 1
+        else:
+            bullet = Bullet(entity, self.tile_sprites, self.groups, bullet_speed, self.all_sprites_group, pool=self)
+            self.created += 1
+        return bullet
+
+    def release(self, bullet):
+        """
+        Returns a killed bullet to the pool.
+
+        Args:
+            bullet (Bullet): Bullet that left all its groups.
+        """
+
+        self.free_bullets.append(bullet)
@@ -0,0 +1,118 @@
+from collections import deque
+
+class FlowField:
+    """
+    Breadth-first distance field toward one goal cell over a WalkableGrid.
+    Every enemy heading to the goal reads its next step in O(1) instead of running A*.
+    """
+
+    def __init__(self, grid, goal):
+        """
+        Builds the field.
+
+        Args:
+            grid (WalkableGrid): Walkability of the map.
+            goal (tuple): (x, y) goal cell.
+        """
+
+        self.grid = grid
+        self.goal = tuple(goal)
+        self.unreachable = len(grid.cells)  # larger than any distance
+        self.rebuild()
+
+    def set_goal(self, goal):
+        """
+        Moves the goal, rebuilding the field only if it changed cell.
+
+        Args:
+            goal (tuple): (x, y) new goal cell.
+        """
+
+        goal = tuple(goal)
+        if goal != self.goal:
+            self.goal = goal
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Recomputes the whole field with a BFS from the goal.
+        """
+
+        grid = self.grid
+        cells = grid.cells
+        offsets = grid.neighbor_offsets
+        distance = [self.unreachable] * len(cells)
+
+        goal = grid.index(*self.goal)
+        distance[goal] = 0
+        queue = deque([goal])
+        while queue:
+            current = queue.popleft()
+            next_distance = distance[current] + 1
+            for _, _, offset in offsets:
+                vecino = current + offset
+                if cells[vecino] and distance[vecino] > next_distance:
+                    distance[vecino] = next_distance
+                    queue.append(vecino)
+
+        self.distance = distance
+
+    def open_cell(self, x, y):
+        """
+        Repairs the field after a cell became walkable: distances can only decrease,
+        so they are propagated from the opened cell without a full rebuild.
+
+        Args:
+            x (int): Column of the opened cell.
+            y (int): Row of the opened cell.
+        """
+
+        grid = self.grid
+        if not grid.contains(x, y):
+            return
+
+        cells = grid.cells
+        offsets = grid.neighbor_offsets
+        distance = self.distance
+        opened = grid.index(x, y)
+
+        best = min(distance[opened + offset] for _, _, offset in offsets) + 1
+        if best >= distance[opened]:
+            return
+
+        distance[opened] = best
+        queue = deque([opened])
+        while queue:
+            current = queue.popleft()
+            next_distance = distance[current] + 1
+            for _, _, offset in offsets:
+                vecino = current + offset
+                if cells[vecino] and distance[vecino] > next_distance:
+                    distance[vecino] = next_distance
+                    queue.append(vecino)
+
+    def next_step(self, cell):
+        """
+        Returns the neighbor cell one step closer to the goal.
+
+        Args:
+            cell (tuple): (x, y) current cell.
+
+        Returns:
+            tuple or None: (x, y) of the next cell, or None at the goal or if the goal is unreachable.
+        """
+
+        grid = self.grid
+        x, y = cell
+        if not grid.contains(x, y):
+            return None
+
+        current = grid.index(x, y)
+        current_distance = self.distance[current]
+        if current_distance == 0 or current_distance >= self.unreachable:
+            return None
+
+        for dx, dy, offset in grid.neighbor_offsets:
+            if self.distance[current + offset] == current_distance - 1:
+                return (x + dx, y + dy)
+        return None
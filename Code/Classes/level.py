@@ -1,13 +1,23 @@
 import random
 import pygame
+from bisect import insort
+from heapq import merge
 
 from Code.Classes import path_request
 from Code.Classes.structure_tile import Structure_tile
+from Code.Classes.surface_cache import ScaledSurfaceCache
+from Code.Classes.static_layer import StaticTileLayer
+from Code.Classes.spatial_hash import SpatialHash, SpatialGroup
+from Code.Classes.tile_grid import ObstacleGroup
+from Code.Classes.tank_group import TankGroup
+from Code.Classes.line_of_sight import LineOfSight
 from Code.Entities.enemy import Enemy
-from Code.Entities.bullet import Bullet
+from Code.Classes.bullet_pool import BulletPool
+from Code.Classes.bullet_engine import BulletEngine, NUMPY_AVAILABLE
 from Code.UI import ui
 from Code.Utilities.settings import *
 from Code.Functions.support import get_random_position, import_csv_layout, import_folder
+from Code.Functions.collision import sweep_hits
 from Code.Classes.tile import Tile
 from Code.Entities.player import Player
 from Code.UI.ui import UI
@@ -15,12 +25,13 @@ from Code.Entities.powerUp import PowerUp
 from random import choice
 
 class Level:
-    def __init__(self, difficulty_config):
+    def __init__(self, difficulty_config, bullet_engine=BULLET_ENGINE):
         """
         Initializes the Level object, sets up all game entities, map, waves, power-ups, and UI.
 
         Args:
             difficulty_config (dict): Configuration for enemy types and counts per difficulty.
+            bullet_engine (str): 'sprites' for Bullet sprites, 'numpy' for the array-based BulletEngine.
         """
 
         # Difficulty configuration
@@ -31,12 +42,35 @@ class Level:
 
         # sprite group setup
         self.visible_sprites = YSortCameraGroup()
-        self.obstacle_sprites = pygame.sprite.Group()
+        self.obstacle_sprites = ObstacleGroup(MAP_COLS, MAP_ROWS)
         self.power_up_sprites = pygame.sprite.Group()
 
         # attack sprites
         self.bullet_sprites = pygame.sprite.Group()
-        self.attackble_sprites = pygame.sprite.Group()
+        self.bullet_counters = {'fired': 0, 'hits': 0, 'peak_live': 0}
+        self.bullet_pool = BulletPool(self.obstacle_sprites, [self.visible_sprites, self.bullet_sprites], self.visible_sprites)
+        self.attackble_sprites = SpatialGroup(TILESIZE, 'rect', mobile_types=('player', 'enemy'))
+        self.tank_sprites = TankGroup()
+
+        # Optional NumPy bullet engine for stress modes
+        self.bullet_engine = None
+        if bullet_engine == 'numpy':
+            if NUMPY_AVAILABLE:
+                self.bullet_engine = BulletEngine(self.attackble_sprites, self.visible_sprites)
+                self.visible_sprites.bullet_engine = self.bullet_engine
+            else:
+                print("NumPy no está instalado, se usan balas con sprites.")
+
+        # Hit handlers by (bullet origin layer, target layer), only for pairs allowed by BULLET_MASKS
+        self.hit_handlers = {
+            (LAYER_PLAYER, LAYER_ENEMY): self.hit_by_player,
+            (LAYER_PLAYER, LAYER_BREAKABLE): self.hit_breakable,
+            (LAYER_PLAYER, LAYER_SOLID): self.hit_solid,
+            (LAYER_ENEMY, LAYER_PLAYER): self.hit_by_enemy,
+            (LAYER_ENEMY, LAYER_STRUCTURE): self.hit_by_enemy,
+            (LAYER_ENEMY, LAYER_BREAKABLE): self.hit_breakable,
+            (LAYER_ENEMY, LAYER_SOLID): self.hit_solid,
+        }
         
         # Wave setup
         self.current_wave = 0
@@ -71,6 +105,11 @@ class Level:
 
         # sprite setup
         self.create_map()
+        self.players = [self.player]  # players enemies may chase, MultiplayerLevel adds the remote one
+        self.line_of_sight = LineOfSight(MAP_COLS, MAP_ROWS)
+        self.line_of_sight.build(self.attackble_sprites)
+        if self.bullet_engine is None:
+            self.bullet_pool.prefill(self.player, BULLET_POOL_SIZE)
 
     def create_map(self):
         """
@@ -88,7 +127,7 @@ class Level:
             'fortress': pygame.image.load('Assets/Objects/Attackable/fortress/Fortress.png').convert_alpha()
         }
 
-        self.player = Player((2020, 2700), [self.visible_sprites, self.attackble_sprites], self.obstacle_sprites, self.create_bullet)
+        self.player = Player((2020, 2700), [self.visible_sprites, self.attackble_sprites, self.tank_sprites], self.obstacle_sprites, self.create_bullet)
 
         for style, layout in layouts.items():
             for row_index, row in enumerate(layout):
@@ -154,72 +193,205 @@ class Level:
             self.enemy =  Enemy(
                 enemy_type,
                 (x * TILESIZE, y * TILESIZE),
-                [self.visible_sprites, self.attackble_sprites],
+                [self.visible_sprites, self.attackble_sprites, self.tank_sprites],
                 self.obstacle_sprites,
                 self.create_bullet,
                 self.player,
                 self.structure,
                 self.matrix_route,
-                path_request=self.path_request
+                path_request=self.path_request,
+                line_of_sight=self.line_of_sight,
+                players=self.players
             )
 
     def create_bullet(self, origin, bullet_speed):
         """
         Creates a bullet entity from the given origin with specified speed.
+        Bullets come from the level's pool, so firing does not allocate surfaces.
 
         Args:
             origin: The entity firing the bullet.
             bullet_speed (float): Speed of the bullet.
         """
-        Bullet(origin, self.obstacle_sprites, [self.visible_sprites, self.bullet_sprites], bullet_speed, self.visible_sprites)
+        if self.bullet_engine is not None:
+            self.bullet_engine.fire(origin, bullet_speed)
+        else:
+            self.bullet_pool.acquire(origin, bullet_speed)
+
+        self.bullet_counters['fired'] += 1
+        self.bullet_counters['peak_live'] = max(self.bullet_counters['peak_live'], self.count_live_bullets())
+
+    def count_live_bullets(self):
+        """
+        Returns the number of bullets in flight, for either bullet engine.
+
+        Returns:
+            int: Live bullets.
+        """
+
+        if self.bullet_engine is not None:
+            return len(self.bullet_engine)
+        return len(self.bullet_sprites)
+
+    def get_bullet_counters(self):
+        """
+        Returns the bullet lifecycle counters of the level.
+
+        Returns:
+            dict: Fired, hits, culled (out of range or out of the world), peak_live and live bullets.
+        """
+
+        counters = dict(self.bullet_counters)
+        counters['live'] = self.count_live_bullets()
+        # Bullets leave the level either on a hit or when Bullet.update culls them
+        counters['culled'] = counters['fired'] - counters['hits'] - counters['live']
+        return counters
 
     def player_attack_logic(self):
         """
         Handles collision detection and logic for player and enemy bullets.
+        With the NumPy engine, bullets are moved and filtered in bulk and only those
+        touching an occupied cell reach the narrow phase.
         """
 
-        if self.bullet_sprites:
+        if self.bullet_engine is not None:
+            # Sprite bullets are updated by visible_sprites and bullet_sprites, so they move twice per frame
+            self.bullet_engine.step(2, self.resolve_bullet)
+
+        elif self.bullet_sprites:
+            # Tanks moved since last frame: update their cells before the bullets query them
+            self.attackble_sprites.refresh()
+
             for bullet_sprite in self.bullet_sprites:
-                collision_sprites = pygame.sprite.spritecollide(
-                    bullet_sprite, self.attackble_sprites, False
-                )                
-                if collision_sprites:
-                    for target_sprite in collision_sprites:
-                        if target_sprite.sprite_type in ['grass', 'walls']:
-                            if bullet_sprite.rect.colliderect(target_sprite.hitbox):
-                                # Get the position in pixels
-                                x, y = target_sprite.rect.topleft
-
-                                # Convert to matrix indexes
-                                row = y // TILESIZE
-                                col = x // TILESIZE
-                                
-                                self.destroyed_tiles_since_last_snapshot.append((row, col))
-
-                                # Update matrix with -1
-                                self.matrix_route[0][row][col] = '-1'
-
-                                # Kill the sprite
-                                target_sprite.kill()
-                                bullet_sprite.explode_and_kill()
-                                break
-                        elif target_sprite.sprite_type == 'structure' and bullet_sprite.origin_type == 'enemy':
-                            target_sprite.get_damage(self.enemy, bullet_sprite.sprite_type)
-                            bullet_sprite.explode_and_kill()
-
-                        elif target_sprite.sprite_type == 'player' and bullet_sprite.origin_type != 'player':
-                            target_sprite.get_damage(self.enemy, bullet_sprite.sprite_type)
-                            bullet_sprite.explode_and_kill()
-
-                        elif target_sprite.sprite_type == 'enemy' and bullet_sprite.origin_type == 'player':
-                            target_sprite.get_damage(self.player, bullet_sprite.sprite_type)
-                            bullet_sprite.explode_and_kill()
-
-                        elif target_sprite.sprite_type == 'rocks' and bullet_sprite.origin_type == 'player' or bullet_sprite.origin_type == 'enemy':
-                            bullet_sprite.explode_and_kill()
-                        
-                        elif target_sprite.sprite_type == 'barrier' and bullet_sprite.origin_type == 'player' or bullet_sprite.origin_type == 'enemy':
-                            bullet_sprite.explode_and_kill()
+                self.resolve_bullet(bullet_sprite)
+
+    def resolve_bullet(self, bullet_sprite):
+        """
+        Narrow phase of one bullet.
+        Bullets are swept over the whole step they moved, so fast bullets cannot
+        tunnel through thin hitboxes; only the first hit along the path is resolved.
+        Targets outside the bullet's collision mask are skipped before any
+        narrow-phase test, the rest go through the hit handler table.
+
+        Args:
+            bullet_sprite (Bullet or BulletView): Bullet to resolve.
+
+        Returns:
+            bool: True if the bullet hit something.
+        """
+
+        collision_mask = bullet_sprite.collision_mask
+        candidates = [
+            sprite for sprite in self.attackble_sprites.collide(bullet_sprite.swept_rect)
+            if sprite.collision_layer & collision_mask
+        ]
+        if candidates:
+            hits = sweep_hits(
+                bullet_sprite.previous_rect, bullet_sprite.swept_rect,
+                bullet_sprite.direction, candidates, self.get_hit_rect
+            )
+            for distance, target_sprite in hits:
+                bullet_sprite.move_to_contact(distance)
+                handler = self.hit_handlers[(bullet_sprite.origin_layer, target_sprite.collision_layer)]
+                if handler(bullet_sprite, target_sprite):
+                    self.bullet_counters['hits'] += 1
+                    return True
+
+        bullet_sprite.start_sweep()
+        return False
+
+    def get_hit_rect(self, sprite):
+        """
+        Returns the rectangle a bullet has to touch to hit a sprite.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Attackable sprite.
+
+        Returns:
+            pygame.Rect: Hitbox for grass and walls, rect for everything else.
+        """
+
+        if sprite.collision_layer & LAYER_BREAKABLE:
+            return sprite.hitbox
+        return sprite.rect
+
+    def hit_breakable(self, bullet_sprite, target_sprite):
+        """
+        Destroys a grass or wall tile hit by a bullet and opens its cell in the route matrix.
+
+        Args:
+            bullet_sprite (Bullet): Bullet that hit the tile.
+            target_sprite (Tile): Tile that was hit.
+
+        Returns:
+            bool: True, the bullet is consumed.
+        """
+
+        # Get the position in pixels
+        x, y = target_sprite.rect.topleft
+
+        # Convert to matrix indexes
+        row = y // TILESIZE
+        col = x // TILESIZE
+
+        self.destroyed_tiles_since_last_snapshot.append((row, col))
+
+        # Update matrix with -1
+        self.matrix_route[0][row][col] = '-1'
+        self.path_request.open_cell(col, row)
+        self.line_of_sight.open_cell((col, row))
+
+        # Kill the sprite
+        target_sprite.kill()
+        bullet_sprite.explode_and_kill()
+        return True
+
+    def hit_by_enemy(self, bullet_sprite, target_sprite):
+        """
+        Damages the player or the fortress with an enemy bullet.
+
+        Args:
+            bullet_sprite (Bullet): Enemy bullet.
+            target_sprite (Player or Structure_tile): Target that was hit.
+
+        Returns:
+            bool: True, the bullet is consumed.
+        """
+
+        target_sprite.get_damage(self.enemy, bullet_sprite.sprite_type)
+        bullet_sprite.explode_and_kill()
+        return True
+
+    def hit_by_player(self, bullet_sprite, target_sprite):
+        """
+        Damages an enemy tank with a player bullet.
+
+        Args:
+            bullet_sprite (Bullet): Player bullet.
+            target_sprite (Enemy): Enemy that was hit.
+
+        Returns:
+            bool: True, the bullet is consumed.
+        """
+
+        target_sprite.get_damage(self.player, bullet_sprite.sprite_type)
+        bullet_sprite.explode_and_kill()
+        return True
+
+    def hit_solid(self, bullet_sprite, target_sprite):
+        """
+        Stops a bullet against a rock or a barrier.
+
+        Args:
+            bullet_sprite (Bullet): Bullet that hit the tile.
+            target_sprite (Tile): Unbreakable tile.
+
+        Returns:
+            bool: True, the bullet is consumed.
+        """
+
+        bullet_sprite.explode_and_kill()
+        return True
 
     def spawn_power_up(self):
         """
@@ -317,6 +489,7 @@ class Level:
                     x = col_index * TILESIZE
                     y = row_index * TILESIZE
 
+                    self.line_of_sight.block((col_index, row_index))
                     Tile(
                         (x, y),
                         [self.visible_sprites, self.attackble_sprites, self.obstacle_sprites],
@@ -333,6 +506,7 @@ class Level:
         self.fortress_shield_applied = False
         for sprite in self.obstacle_sprites.sprites():
             if getattr(sprite, 'sprite_type', None) == 'barrier':
+                self.line_of_sight.open_cell((sprite.rect.x // TILESIZE, sprite.rect.y // TILESIZE))
                 sprite.kill()
 
     def run(self):
@@ -342,6 +516,7 @@ class Level:
         """
 
         # 1 - Logic and sprites
+        self.tank_sprites.refresh()
         self.visible_sprites.update()
         self.visible_sprites.enemy_update(self.player)
         self.visible_sprites.structure_update()
@@ -362,9 +537,13 @@ class Level:
 
 
 class YSortCameraGroup(pygame.sprite.Group):
-    def __init__(self):
+    def __init__(self, render_mode=RENDER_MODE):
         """
         Initializes the camera group for rendering sprites with Y-sorting and zoom.
+
+        Args:
+            render_mode (str): 'scaled_sprites' scales every sprite onto the screen,
+                'viewport' draws the world 1:1 off-screen and scales it once.
         """
 
         super().__init__()
@@ -379,6 +558,185 @@ class YSortCameraGroup(pygame.sprite.Group):
 
         # Zoom camera
         self.zoom_factor = 0.7  # Zoom out 
+        self.render_mode = render_mode
+        self.viewport_surf = None  # off-screen world surface used by the 'viewport' mode
+
+        # Floor scaled to the current zoom, rebuilt only when the zoom changes
+        self.scaled_floor_surf = None
+        self.scaled_floor_zoom = None
+
+        # Scaled sprite images, invalidated when the zoom changes
+        self.scaled_sprites = ScaledSurfaceCache(SCALED_SURFACE_CACHE_SIZE)
+
+        # Static tiles baked into chunk surfaces
+        self.static_layer = StaticTileLayer(STATIC_CHUNK_TILES)
+        self.pending_sprites = []  # sprite attributes are set after joining the group
+
+        # Chunk buckets of the moving sprites, used for camera culling
+        self.sprite_index = SpatialHash(STATIC_CHUNK_TILES * TILESIZE)
+        self.dynamic_sprites = set()  # sprites whose bucket must follow their rect
+
+        # Static sprites kept sorted by centery inside each chunk row band
+        self.band_height = STATIC_CHUNK_TILES * TILESIZE
+        self.static_bands = {}        # band index -> sprites sorted by centery
+        self.static_sprite_bands = {} # sprite -> band index
+
+        # Optional BulletEngine whose bullets are drawn as views, set by Level
+        self.bullet_engine = None
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Adds a sprite to the group and queues it for classification on the next draw.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite being added.
+            layer: Unused, kept for pygame compatibility.
+        """
+
+        super().add_internal(sprite, layer)
+        self.pending_sprites.append(sprite)
+
+    def remove_internal(self, sprite):
+        """
+        Removes a sprite from the group, re-baking its static chunk if it had one.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite being removed.
+        """
+
+        super().remove_internal(sprite)
+        self.static_layer.remove(sprite)
+        self.sprite_index.remove(sprite)
+        self.dynamic_sprites.discard(sprite)
+        self.remove_static_sprite(sprite)
+
+    def register_pending_sprites(self):
+        """
+        Moves newly added static tiles into the baked static layer, other
+        static sprites into their row band and indexes moving sprites by chunk.
+        """
+
+        for sprite in self.pending_sprites:
+            if sprite not in self.spritedict:
+                continue
+
+            sprite_type = getattr(sprite, 'sprite_type', None)
+            if sprite_type in BAKED_TILE_TYPES:
+                self.static_layer.add(sprite)
+            elif sprite_type in STATIC_SPRITE_TYPES:
+                self.add_static_sprite(sprite)
+            else:
+                self.sprite_index.insert(sprite, sprite.rect)
+                self.dynamic_sprites.add(sprite)
+        self.pending_sprites.clear()
+
+    def add_static_sprite(self, sprite):
+        """
+        Inserts a static sprite into its row band, keeping the band sorted.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Static sprite to insert.
+        """
+
+        band = sprite.rect.centery // self.band_height
+        insort(self.static_bands.setdefault(band, []), sprite, key=lambda s: s.rect.centery)
+        self.static_sprite_bands[sprite] = band
+
+    def remove_static_sprite(self, sprite):
+        """
+        Removes a static sprite from its row band. Unknown sprites are ignored.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Static sprite to remove.
+        """
+
+        band = self.static_sprite_bands.pop(sprite, None)
+        if band is not None:
+            self.static_bands[band].remove(sprite)
+
+    def get_visible_static_sprites(self, camera_world_rect):
+        """
+        Returns the static sprites under the camera, already sorted by centery.
+
+        Args:
+            camera_world_rect (pygame.Rect): Camera rectangle in world coordinates.
+
+        Returns:
+            list: Visible static sprites in draw order.
+        """
+
+        # One extra band on each side catches sprites taller than their band
+        first_band = camera_world_rect.top // self.band_height - 1
+        last_band = camera_world_rect.bottom // self.band_height + 1
+
+        visible = []
+        for band in range(first_band, last_band + 1):
+            for sprite in self.static_bands.get(band, ()):
+                if camera_world_rect.colliderect(sprite.rect):
+                    visible.append(sprite)
+        return visible
+
+    def update_sprite_index(self):
+        """
+        Moves dynamic sprites to a new chunk bucket when they cross a chunk border.
+        """
+
+        for sprite in self.dynamic_sprites:
+            self.sprite_index.move(sprite, sprite.rect)
+
+    def get_scaled_floor(self):
+        """
+        Returns the floor surface scaled to the current zoom factor.
+        The scaled surface is cached and only recomputed when the zoom changes.
+
+        Returns:
+            pygame.Surface: Floor surface at the current zoom.
+        """
+
+        if self.scaled_floor_surf is None or self.scaled_floor_zoom != self.zoom_factor:
+            self.scaled_floor_surf = pygame.transform.scale(
+                self.floor_surf,
+                (int(self.floor_surf.get_width() * self.zoom_factor),
+                 int(self.floor_surf.get_height() * self.zoom_factor))
+            )
+            self.scaled_floor_zoom = self.zoom_factor
+
+        return self.scaled_floor_surf
+
+    def draw_floor(self, surface, scale):
+        """
+        Draws only the part of the floor that lies under the camera.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+            scale (float): Scale from world pixels to surface pixels.
+        """
+
+        floor = self.floor_surf if scale == 1 else self.get_scaled_floor()
+        floor_screen_x = int((self.floor_rect.left - self.offset.x) * scale)
+        floor_screen_y = int((self.floor_rect.top - self.offset.y) * scale)
+
+        # Surface rectangle expressed in floor coordinates
+        view_rect = surface.get_rect(topleft=(-floor_screen_x, -floor_screen_y))
+        area = view_rect.clip(floor.get_rect())
+
+        if area.width and area.height:
+            surface.blit(floor, (area.x - view_rect.x, area.y - view_rect.y), area)
+
+    def get_viewport_surface(self, size):
+        """
+        Returns the off-screen surface the world is drawn on in 'viewport' mode.
+
+        Args:
+            size (tuple): (width, height) of the camera in world pixels.
+
+        Returns:
+            pygame.Surface: Viewport surface of the given size.
+        """
+
+        if self.viewport_surf is None or self.viewport_surf.get_size() != size:
+            self.viewport_surf = pygame.Surface(size).convert()
+        return self.viewport_surf
 
     def custom_draw(self, player):
         """
@@ -401,36 +759,48 @@ class YSortCameraGroup(pygame.sprite.Group):
             int(screen_h / self.zoom_factor)
         )
 
+        # 'viewport' draws the world 1:1 and scales once, otherwise every sprite is scaled
+        if self.render_mode == 'viewport':
+            target = self.get_viewport_surface(camera_world_rect.size)
+            scale = 1
+        else:
+            target = self.display_surface
+            scale = self.zoom_factor
+
         # Draw floor
-        scaled_floor = pygame.transform.scale(
-            self.floor_surf,
-            (int(self.floor_surf.get_width() * self.zoom_factor),
-             int(self.floor_surf.get_height() * self.zoom_factor))
+        self.draw_floor(target, scale)
+        self.scaled_sprites.set_zoom(scale)
+
+        # Draw baked static tiles
+        self.register_pending_sprites()
+        self.static_layer.set_zoom(scale)
+        self.static_layer.draw(target, camera_world_rect, self.offset)
+
+        # Draw only sprites in the chunks under the camera (world culling).
+        # Static sprites are pre-sorted, so only moving sprites are sorted each frame.
+        self.update_sprite_index()
+        visible_dynamic = sorted(
+            (sprite for sprite in self.sprite_index.query(camera_world_rect)
+             if camera_world_rect.colliderect(sprite.rect)),
+            key=lambda s: s.rect.centery
         )
-        floor_screen_pos = ((self.floor_rect.left - self.offset.x) * self.zoom_factor,
-                            (self.floor_rect.top  - self.offset.y) * self.zoom_factor)
-
-        # Only blit if it intersects with the screen
-        floor_screen_rect = scaled_floor.get_rect(topleft=(int(floor_screen_pos[0]), int(floor_screen_pos[1])))
-        if self.display_surface.get_rect().colliderect(floor_screen_rect):
-            self.display_surface.blit(scaled_floor, floor_screen_rect.topleft)
-
-        # Draw only sprites inside the camera (world culling)
-        for sprite in sorted(self.sprites(), key=lambda s: s.rect.centery):
-            # If the sprite's rect (in world) doesn't intersect the camera, skip it
-            if not camera_world_rect.colliderect(sprite.rect):
-                continue
+        visible_static = self.get_visible_static_sprites(camera_world_rect)
+        visible_bullets = self.bullet_engine.get_visible_views(camera_world_rect) if self.bullet_engine is not None else []
 
-            # Position and size on screen (with zoom)
-            screen_x = int((sprite.rect.left  - self.offset.x) * self.zoom_factor)
-            screen_y = int((sprite.rect.top   - self.offset.y) * self.zoom_factor)
-            screen_w_s = int(sprite.rect.width  * self.zoom_factor)
-            screen_h_s = int(sprite.rect.height * self.zoom_factor)
+        for sprite in merge(visible_static, visible_dynamic, visible_bullets, key=lambda s: s.rect.centery):
 
-            # Scale the image (warning: expensive if done every frame)
-            scaled_sprite = pygame.transform.scale(sprite.image, (screen_w_s, screen_h_s))
+            # Position on the target surface (with zoom)
+            screen_x = int((sprite.rect.left  - self.offset.x) * scale)
+            screen_y = int((sprite.rect.top   - self.offset.y) * scale)
 
-            self.display_surface.blit(scaled_sprite, (screen_x, screen_y))
+            if scale == 1:
+                target.blit(sprite.image, (screen_x, screen_y))
+            else:
+                # Scaled images are cached, so static tiles and shared frames are resampled once
+                screen_w_s = int(sprite.rect.width  * scale)
+                screen_h_s = int(sprite.rect.height * scale)
+                scaled_sprite = self.scaled_sprites.get(sprite.image, (screen_w_s, screen_h_s))
+                target.blit(scaled_sprite, (screen_x, screen_y))
 
             if sprite.sprite_type == 'enemy' or sprite.sprite_type == 'structure':
                 # Health ratio
@@ -441,17 +811,21 @@ class YSortCameraGroup(pygame.sprite.Group):
                         health_ratio = max(sprite.health, 0) / estructure_data[sprite.name]['health']
 
                 # Bar size and position
-                bar_width = int(sprite.rect.width * self.zoom_factor)
-                bar_height = max(int(10 * self.zoom_factor), 2)
+                bar_width = int(sprite.rect.width * scale)
+                bar_height = max(int(10 * scale), 2)
                 bar_x = screen_x
-                bar_y = screen_y - int(20 * self.zoom_factor)
+                bar_y = screen_y - int(20 * scale)
 
                 background_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
                 health_rect = pygame.Rect(bar_x, bar_y, int(bar_width * health_ratio), bar_height)
 
-                pygame.draw.rect(self.display_surface, (255, 0, 0), background_rect)
-                pygame.draw.rect(self.display_surface, (0, 255, 0), health_rect)
-                pygame.draw.rect(self.display_surface, (0, 0, 0), background_rect, 2)
+                pygame.draw.rect(target, (255, 0, 0), background_rect)
+                pygame.draw.rect(target, (0, 255, 0), health_rect)
+                pygame.draw.rect(target, (0, 0, 0), background_rect, 2)
+
+        # Single scale of the whole viewport onto the display
+        if target is not self.display_surface:
+            pygame.transform.scale(target, (screen_w, screen_h), self.display_surface)
 
     def enemy_update(self, player):
         """
@@ -0,0 +1,161 @@
+from Code.Utilities.settings import *
+
+class LineOfSight:
+    """
+    Line-of-sight service over the grid of cells that stop bullets.
+    Rays are traced with an integer DDA grid traversal and cached per (start cell, target cell);
+    the cache is invalidated when cells are opened (tiles destroyed) or blocked (barriers).
+    """
+
+    def __init__(self, cols, rows):
+        """
+        Initializes an empty grid, with every cell clear.
+
+        Args:
+            cols (int): Number of columns of the map.
+            rows (int): Number of rows of the map.
+        """
+
+        self.cols = cols
+        self.rows = rows
+        self.blocked = bytearray(cols * rows)  # number of blocking tiles per cell
+        self.cache = {}  # (start cell, target cell) -> bool
+        self.hits = 0
+        self.misses = 0
+
+    def build(self, sprites):
+        """
+        Marks the cells of the sprites that stop bullets (breakable and solid layers) as blocked.
+
+        Args:
+            sprites (iterable): Attackable sprites.
+        """
+
+        for sprite in sprites:
+            if sprite.collision_layer & (LAYER_BREAKABLE | LAYER_SOLID):
+                self.block((sprite.rect.x // TILESIZE, sprite.rect.y // TILESIZE))
+
+    def block(self, cell):
+        """
+        Adds a blocking tile to a cell and drops the cached rays that were clear.
+
+        Args:
+            cell (tuple): (col, row) of the cell.
+        """
+
+        col, row = cell
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            index = row * self.cols + col
+            self.blocked[index] += 1
+            if self.blocked[index] == 1:
+                # Only a clear ray can become blocked
+                self.cache = {key: clear for key, clear in self.cache.items() if not clear}
+
+    def open_cell(self, cell):
+        """
+        Removes a blocking tile from a cell (e.g. a destroyed wall) and, once the cell
+        is clear, drops the cached rays that were blocked.
+
+        Args:
+            cell (tuple): (col, row) of the cell.
+        """
+
+        col, row = cell
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            index = row * self.cols + col
+            if self.blocked[index]:
+                self.blocked[index] -= 1
+                if not self.blocked[index]:
+                    # Only a blocked ray can become clear
+                    self.cache = {key: clear for key, clear in self.cache.items() if clear}
+
+    def is_blocked(self, cell):
+        """
+        Checks if a cell stops bullets. Cells outside the map are clear.
+
+        Args:
+            cell (tuple): (col, row) of the cell.
+
+        Returns:
+            bool: True if at least one blocking tile is in the cell.
+        """
+
+        col, row = cell
+        return 0 <= col < self.cols and 0 <= row < self.rows and self.blocked[row * self.cols + col] > 0
+
+    def is_clear(self, start_cell, target_cell):
+        """
+        Returns whether nothing stops a bullet between two cells, using the cache when possible.
+
+        Args:
+            start_cell (tuple): (col, row) of the shooter.
+            target_cell (tuple): (col, row) of the target.
+
+        Returns:
+            bool: True if the line between both cells is clear.
+        """
+
+        key = (start_cell, target_cell)
+        clear = self.cache.get(key)
+        if clear is not None:
+            self.hits += 1
+            return clear
+
+        self.misses += 1
+        if len(self.cache) >= LOS_CACHE_SIZE:
+            self.cache.clear()
+        clear = self.raycast(start_cell, target_cell)
+        self.cache[key] = clear
+        return clear
+
+    def raycast(self, start_cell, target_cell):
+        """
+        Walks the cells crossed by the segment between both cell centers (DDA).
+        The start and target cells themselves are not tested. Crossings are compared
+        with integers, so corners are exact and raycast(a, b) == raycast(b, a).
+
+        Args:
+            start_cell (tuple): (col, row) of the shooter.
+            target_cell (tuple): (col, row) of the target.
+
+        Returns:
+            bool: True if no crossed cell is blocked.
+        """
+
+        x, y = start_cell
+        end_x, end_y = target_cell
+        dx = end_x - x
+        dy = end_y - y
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+
+        # The k-th column border is crossed at t = (2k+1) / (2|dx|) and the m-th row border
+        # at t = (2m+1) / (2|dy|): compare (2k+1)*|dy| with (2m+1)*|dx| instead of floats
+        abs_dx = abs(dx)
+        abs_dy = abs(dy)
+        next_x = abs_dy
+        next_y = abs_dx
+
+        cols = self.cols
+        blocked = self.blocked
+
+        while (x, y) != (end_x, end_y):
+            if next_x < next_y:
+                x += step_x
+                next_x += 2 * abs_dy
+            elif next_y < next_x:
+                y += step_y
+                next_y += 2 * abs_dx
+            else:
+                # The ray goes through a corner: blocked if either side cell is
+                if blocked[y * cols + x + step_x] or blocked[(y + step_y) * cols + x]:
+                    return False
+                x += step_x
+                y += step_y
+                next_x += 2 * abs_dy
+                next_y += 2 * abs_dx
+
+            if (x, y) != (end_x, end_y) and blocked[y * cols + x]:
+                return False
+
+        return True
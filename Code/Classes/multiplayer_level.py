@@ -6,6 +6,7 @@ from Code.Entities.powerUp import PowerUp
 from Code.Utilities.settings import *
 from Code.Entities.bullet import Bullet
 from Code.Entities.Explosion import Explosion
+from Code.Functions.support import ASSET_CACHE
 
 class MultiplayerLevel:
     def __init__(self, difficulty_config, network_client, player_number):
@@ -17,7 +18,8 @@ class MultiplayerLevel:
         self.display_surface = pygame.display.get_surface()
 
         try:
-            self.level = Level(difficulty_config)
+            # Bullets must be sprites to be part of the network snapshot
+            self.level = Level(difficulty_config, bullet_engine='sprites')
             self.network_entities = {}
             self.next_network_id = 0
             host_spawn_pos = (2020, 2700)
@@ -26,13 +28,15 @@ class MultiplayerLevel:
             if self.player_number == 1: # Soy Anfitrión
                 self.local_player = self.level.player
                 self.local_player.is_local = True
-                self.remote_player = Player(guest_spawn_pos, [self.level.visible_sprites, self.level.attackble_sprites], 
+                self.remote_player = Player(guest_spawn_pos, [self.level.visible_sprites, self.level.attackble_sprites, self.level.tank_sprites], 
                                             self.level.obstacle_sprites, self.level.create_bullet, is_local=False)
+                self.level.players.append(self.remote_player)
             else: # Soy Invitado
                 self.remote_player = self.level.player
                 self.remote_player.is_local = False
                 self.remote_player.rect.topleft = host_spawn_pos
-                self.local_player = Player(guest_spawn_pos, [self.level.visible_sprites, self.level.attackble_sprites], 
+                self.remote_player.hitbox.center = self.remote_player.rect.center
+                self.local_player = Player(guest_spawn_pos, [self.level.visible_sprites, self.level.attackble_sprites, self.level.tank_sprites], 
                                            self.level.obstacle_sprites, self.level.create_bullet, is_local=True)
                 self.level.player = self.local_player
 
@@ -106,6 +110,7 @@ class MultiplayerLevel:
             }
             self.network_client.send_player_action('input', action_data)
             
+            self.level.tank_sprites.refresh()
             self.level.visible_sprites.update()
             
             self.level.visible_sprites.custom_draw(self.local_player)
@@ -189,6 +194,9 @@ class MultiplayerLevel:
                 current_pos = pygame.math.Vector2(sprite.rect.center)
                 target_pos = pygame.math.Vector2(data['pos'])
                 sprite.rect.center = current_pos.lerp(target_pos, 0.25) 
+                # Replicas don't move themselves: their hitbox follows the network so tank separation matches the host
+                if sprite is not self.local_player and hasattr(sprite, 'hitbox'):
+                    sprite.hitbox.center = sprite.rect.center
 
                 if 'health' in data and hasattr(sprite, 'health'):
                     sprite.health = data['health']
@@ -201,7 +209,7 @@ class MultiplayerLevel:
                 
                 new_sprite = None
                 if sprite_type == 'enemy':
-                    new_sprite = Enemy(data['name'], pos, [self.level.visible_sprites, self.level.attackble_sprites],
+                    new_sprite = Enemy(data['name'], pos, [self.level.visible_sprites, self.level.attackble_sprites, self.level.tank_sprites],
                                       self.level.obstacle_sprites, self.level.create_bullet, 
                                       self.remote_player, 
                                       self.level.structure, self.level.matrix_route, self.level.path_request)
@@ -214,8 +222,7 @@ class MultiplayerLevel:
 
                 elif sprite_type == 'bullet':
                     bullet = pygame.sprite.Sprite() 
-                    bullet.image = pygame.image.load('Assets/Entities/Bullet/bullet.png').convert_alpha()
-                    bullet.image = pygame.transform.scale(bullet.image, (25, 25))
+                    bullet.image = ASSET_CACHE['bullet']
                     bullet.rect = bullet.image.get_rect(center=pos)
                     bullet.sprite_type = 'bullet' 
                     self.level.visible_sprites.add(bullet)
@@ -1,11 +1,369 @@
 import json
+import weakref
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from Code.Functions.A_star import a_star
+from Code.Utilities.settings import *
+from Code.Functions.A_star import a_star, a_star_grid
+from Code.Functions.path_worker import shared_memory, attach_grid, search_path
+from Code.Classes.walkable_grid import WalkableGrid
+from Code.Classes.flow_field import FlowField
+
+def release_workers(executor, shared_cells):
+    """
+    Stops a pathfinding pool and frees its shared grid.
+
+    Args:
+        executor (ProcessPoolExecutor): Pool to stop.
+        shared_cells (SharedMemory): Shared copy of the walkability grid.
+    """
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    shared_cells.close()
+    try:
+        shared_cells.unlink()
+    except FileNotFoundError:
+        pass
+
+def completed_future(ruta):
+    """
+    Wraps a path computed on the main thread in an already finished future.
+
+    Args:
+        ruta (list): Path or None.
+
+    Returns:
+        Future: Future whose result is (ruta, None).
+    """
+
+    future = Future()
+    future.set_result((ruta, None))
+    return future
 
 class PathRequest:
     """
     Handles pathfinding requests using the A* algorithm.
     """
+    def __init__(self, engine=PATHFINDING_ENGINE, workers=PATHFINDING_WORKERS):
+        """
+        Initializes the path request handler.
+
+        Args:
+            engine (str): 'grid' for the array-backed A*, 'matrix' for a_star() over the string matrix.
+            workers (int): Processes used by solicitar_ruta_async, 0 to search synchronously.
+        """
+
+        self.engine = engine
+        self.grid = None
+        self.grid_matrix = None  # matrix the grid was built from
+        self.flow_fields = {}    # goal cell -> FlowField shared by every enemy
+        self.player_fields = {}  # player -> FlowField rooted at the player's cell
+
+        # LRU of grid A* results: (start, goal, grid version) -> (path, explored cells)
+        self.path_cache = OrderedDict()
+        self.cache_size = PATH_CACHE_SIZE
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_invalidations = 0
+
+        # Asynchronous searches, started lazily by solicitar_ruta_async
+        self.workers = workers if shared_memory is not None else 0
+        self.executor = None
+        self.shared_cells = None      # SharedMemory copy of grid.cells read by the workers
+        self.release = None           # finalizer that stops the pool with this object
+        self.pending_paths = {}       # (start, goal, grid version) -> Future
+        self.pending_keys = {}        # Future -> (start, goal, grid version)
+
+    def get_grid(self, matrix):
+        """
+        Returns the walkability grid of a matrix, building it the first time.
+
+        Args:
+            matrix (list): 2D map matrix.
+
+        Returns:
+            WalkableGrid: Grid of the matrix.
+        """
+
+        if self.grid is None or self.grid_matrix is not matrix:
+            self.grid = WalkableGrid(matrix)
+            self.grid_matrix = matrix
+            self.flow_fields = {}
+            self.player_fields = {}
+            self.path_cache.clear()
+            self.stop_workers()
+        return self.grid
+
+    def get_flow_field(self, matrix, goal):
+        """
+        Returns the shared flow field toward a goal, building it the first time.
+
+        Args:
+            matrix (list): 2D map matrix.
+            goal (tuple): (x, y) goal cell.
+
+        Returns:
+            FlowField: Field toward the goal.
+        """
+
+        grid = self.get_grid(matrix)
+        goal = tuple(goal)
+        field = self.flow_fields.get(goal)
+        if field is None:
+            field = FlowField(grid, goal)
+            self.flow_fields[goal] = field
+        return field
+
+    def get_player_field(self, matrix, player):
+        """
+        Returns the distance field rooted at a player's cell, shared by every enemy chasing
+        that player. It is only recomputed when the player moves to another cell.
+
+        Args:
+            matrix (list): 2D map matrix.
+            player (Player): Player being chased.
+
+        Returns:
+            FlowField: Field toward the player.
+        """
+
+        grid = self.get_grid(matrix)
+        player_pos = tuple(player.get_grid_position())
+        field = self.player_fields.get(player)
+        if field is None:
+            field = FlowField(grid, player_pos)
+            self.player_fields[player] = field
+        else:
+            field.set_goal(player_pos)
+        return field
+
+    def open_cell(self, col, row):
+        """
+        Marks a cell of the route matrix as walkable after its tile was destroyed.
+
+        Args:
+            col (int): Column of the cell.
+            row (int): Row of the cell.
+        """
+
+        if self.grid is not None:
+            version = self.grid.version
+            self.grid.set_walkable(col, row, True)
+            if self.grid.version != version:
+                self.invalidate_paths(col, row)
+                if self.shared_cells is not None:
+                    self.shared_cells.buf[self.grid.index(col, row)] = 1
+            for field in self.flow_fields.values():
+                field.open_cell(col, row)
+            for field in self.player_fields.values():
+                field.open_cell(col, row)
+
+    def invalidate_paths(self, col, row):
+        """
+        Drops the cached paths whose search read the changed cell (expanded it or one of
+        its neighbors) and moves the others to the current grid version.
+
+        Args:
+            col (int): Column of the changed cell.
+            row (int): Row of the changed cell.
+        """
+
+        grid = self.grid
+        changed = grid.index(col, row)
+        touched = {changed}
+        touched.update(changed + offset for _, _, offset in grid.neighbor_offsets)
+
+        cache = OrderedDict()
+        for (start, goal, _), (ruta, explored) in self.path_cache.items():
+            if touched.isdisjoint(explored):
+                cache[(start, goal, grid.version)] = (ruta, explored)
+            else:
+                self.cache_invalidations += 1
+        self.path_cache = cache
+
+    def find_grid_path(self, start, goal, grid):
+        """
+        Returns the grid A* path between two cells, from the LRU cache when possible.
+
+        Args:
+            start (tuple): (x, y) start cell.
+            goal (tuple): (x, y) goal cell.
+            grid (WalkableGrid): Walkability of the map.
+
+        Returns:
+            list or None: A copy of the path, or None if no path exists.
+        """
+
+        key = (start, goal, grid.version)
+        cached = self.path_cache.get(key)
+        if cached is not None:
+            self.path_cache.move_to_end(key)
+            self.cache_hits += 1
+            ruta = cached[0]
+        else:
+            self.cache_misses += 1
+            explored = []
+            ruta = a_star_grid(start, goal, grid, explored)
+            self.path_cache[key] = (ruta, frozenset(explored))
+            if len(self.path_cache) > self.cache_size:
+                self.path_cache.popitem(last=False)
+
+        # Enemies consume their path, so each caller gets its own list
+        return list(ruta) if ruta is not None else None
+
+    def start_workers(self, grid):
+        """
+        Starts the pathfinding pool and shares the walkability grid with it.
+
+        Args:
+            grid (WalkableGrid): Grid the workers search.
+
+        Returns:
+            bool: True if the pool is running, False to fall back to synchronous searches.
+        """
+
+        if self.executor is not None:
+            return True
+        if self.workers <= 0:
+            return False
+
+        size = len(grid.cells)
+        try:
+            self.shared_cells = shared_memory.SharedMemory(create=True, size=size)
+            self.shared_cells.buf[:size] = grid.cells
+            # spawn: the workers don't inherit pygame/SDL state from the game process
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=attach_grid,
+                initargs=(self.shared_cells.name, size, grid.cols, grid.rows),
+            )
+        except (OSError, ValueError) as e:
+            print("No se pudo iniciar el pool de rutas, se calculan en el hilo principal:", e)
+            if self.shared_cells is not None:
+                self.shared_cells.close()
+                self.shared_cells.unlink()
+                self.shared_cells = None
+            self.workers = 0
+            return False
+
+        self.release = weakref.finalize(self, release_workers, self.executor, self.shared_cells)
+        return True
+
+    def stop_workers(self):
+        """
+        Stops the pathfinding pool, if any. Pending requests are dropped.
+        """
+
+        if self.release is not None:
+            self.release()
+        self.release = None
+        self.executor = None
+        self.shared_cells = None
+        self.pending_paths.clear()
+        self.pending_keys.clear()
+
+    def solicitar_ruta_async(self, matriz_ruta, coordenada_enemigo, coordenada_jugador):
+        """
+        Requests a path without blocking the frame. Grid searches run in the worker pool;
+        cached paths, 'matrix' searches and cells outside the map are resolved right away.
+        Enemies only call it when FORTRESS_FLOW_FIELD or PLAYER_FLOW_FIELDS is disabled.
+
+        Args:
+            matriz_ruta (list): Matrix representing the map for pathfinding.
+            coordenada_enemigo (tuple): (x, y) grid position of the enemy.
+            coordenada_jugador (tuple): (x, y) grid position of the player.
+
+        Returns:
+            Future: Read it with get_path_result() once it is done.
+        """
+
+        if self.engine != 'grid' or self.workers <= 0:
+            return completed_future(self.solicitar_ruta(matriz_ruta, coordenada_enemigo, coordenada_jugador))
+
+        grid = self.get_grid(matriz_ruta[0])
+        start = tuple(coordenada_jugador)
+        goal = tuple(coordenada_enemigo)
+        if not (grid.contains(*start) and grid.contains(*goal)):
+            return completed_future(a_star(coordenada_jugador, coordenada_enemigo, matriz_ruta[0]))
+
+        key = (start, goal, grid.version)
+        cached = self.path_cache.get(key)
+        if cached is not None:
+            self.path_cache.move_to_end(key)
+            self.cache_hits += 1
+            return completed_future(cached[0])
+
+        # Enemies asking for the same route share one search
+        future = self.pending_paths.get(key)
+        if future is not None:
+            return future
+
+        if self.start_workers(grid):
+            try:
+                future = self.executor.submit(search_path, start, goal)
+            except (BrokenProcessPool, RuntimeError):
+                self.stop_workers()
+                self.workers = 0
+            else:
+                self.cache_misses += 1
+                self.pending_paths[key] = future
+                self.pending_keys[future] = key
+                return future
+
+        return completed_future(self.find_grid_path(start, goal, grid))
+
+    def get_path_result(self, future):
+        """
+        Returns the path of a finished request and adds worker results to the path cache.
+        If the pool failed, the path is computed synchronously.
+
+        Args:
+            future (Future): Finished future returned by solicitar_ruta_async.
+
+        Returns:
+            list or None: A copy of the path, or None if no path exists.
+        """
+
+        key = self.pending_keys.pop(future, None)
+        if key is not None:
+            del self.pending_paths[key]
+
+        try:
+            ruta, explored = future.result()
+        except Exception as e:
+            print("Error en el pool de rutas, se calcula en el hilo principal:", e)
+            if key is None:
+                return None
+            self.stop_workers()
+            self.workers = 0
+            return self.find_grid_path(key[0], key[1], self.grid)
+
+        # Results of an older grid are still usable, opened cells only add shortcuts
+        if key is not None and key[2] == self.grid.version:
+            self.path_cache[key] = (ruta, frozenset(explored))
+            if len(self.path_cache) > self.cache_size:
+                self.path_cache.popitem(last=False)
+
+        return list(ruta) if ruta is not None else None
+
+    def get_cache_stats(self):
+        """
+        Returns the path cache counters.
+
+        Returns:
+            dict: Hits, misses, invalidations and current size of the cache.
+        """
+
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'invalidations': self.cache_invalidations,
+            'size': len(self.path_cache),
+        }
+
     def solicitar_ruta(self, matriz_ruta, coordenada_enemigo, coordenada_jugador):
         """
         Requests a path from the enemy to the player using the A* algorithm.
@@ -19,10 +377,17 @@ class PathRequest:
             list: The calculated path as a list of coordinates, or None if an error occurs.
         """
     
-        ruta = a_star(coordenada_jugador,coordenada_enemigo, matriz_ruta[0])
+        if self.engine == 'grid':
+            grid = self.get_grid(matriz_ruta[0])
+            if grid.contains(*coordenada_jugador) and grid.contains(*coordenada_enemigo):
+                ruta = self.find_grid_path(tuple(coordenada_jugador), tuple(coordenada_enemigo), grid)
+            else:
+                ruta = a_star(coordenada_jugador, coordenada_enemigo, matriz_ruta[0])
+        else:
+            ruta = a_star(coordenada_jugador,coordenada_enemigo, matriz_ruta[0])
 
         try:
             return ruta
         except json.JSONDecodeError as e:
             print("Error al decodificar la respuesta JSON:", e)
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,229 @@
+import pygame
+
+class SpatialHash:
+    """
+    Uniform grid that buckets items by the cells their rectangle overlaps.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Initializes an empty spatial hash.
+
+        Args:
+            cell_size (int): Width and height of a cell in pixels.
+        """
+
+        self.cell_size = cell_size
+        self.cells = {}       # (cell_x, cell_y) -> set of items
+        self.item_cells = {}  # item -> (first_x, first_y, last_x, last_y)
+
+    def __contains__(self, item):
+        return item in self.item_cells
+
+    def __len__(self):
+        return len(self.item_cells)
+
+    def cell_range(self, rect):
+        """
+        Returns the range of cells covered by a rectangle.
+
+        Args:
+            rect (pygame.Rect): Rectangle in world coordinates.
+
+        Returns:
+            tuple: (first_x, first_y, last_x, last_y), inclusive.
+        """
+
+        size = self.cell_size
+        first_x = rect.left // size
+        first_y = rect.top // size
+        last_x = max(first_x, (rect.right - 1) // size)
+        last_y = max(first_y, (rect.bottom - 1) // size)
+        return (first_x, first_y, last_x, last_y)
+
+    def insert(self, item, rect):
+        """
+        Adds an item to every cell its rectangle overlaps.
+
+        Args:
+            item: Hashable item to store.
+            rect (pygame.Rect): Rectangle of the item in world coordinates.
+        """
+
+        cell_range = self.cell_range(rect)
+        first_x, first_y, last_x, last_y = cell_range
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                self.cells.setdefault((cell_x, cell_y), set()).add(item)
+        self.item_cells[item] = cell_range
+
+    def remove(self, item):
+        """
+        Removes an item from the hash. Unknown items are ignored.
+
+        Args:
+            item: Item to remove.
+        """
+
+        cell_range = self.item_cells.pop(item, None)
+        if cell_range is None:
+            return
+
+        first_x, first_y, last_x, last_y = cell_range
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket is not None:
+                    bucket.discard(item)
+                    if not bucket:
+                        del self.cells[(cell_x, cell_y)]
+
+    def move(self, item, rect):
+        """
+        Re-buckets an item only if its rectangle now covers different cells.
+
+        Args:
+            item: Item already stored in the hash.
+            rect (pygame.Rect): New rectangle of the item.
+        """
+
+        if self.item_cells.get(item) != self.cell_range(rect):
+            self.remove(item)
+            self.insert(item, rect)
+
+    def query(self, rect):
+        """
+        Returns the items stored in the cells overlapped by a rectangle.
+        This is a broad phase: the items' rectangles may not overlap the query.
+
+        Args:
+            rect (pygame.Rect): Query rectangle in world coordinates.
+
+        Returns:
+            set: Candidate items.
+        """
+
+        first_x, first_y, last_x, last_y = self.cell_range(rect)
+        found = set()
+        cells = self.cells
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    found |= bucket
+        return found
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    Sprite group that keeps its sprites in a SpatialHash so rectangle queries
+    only look at the sprites in the cells they overlap.
+    """
+
+    def __init__(self, cell_size, rect_attr='rect', *sprites, mobile_types=()):
+        """
+        Initializes the group and its spatial index.
+
+        Args:
+            cell_size (int): Width and height of a hash cell in pixels.
+            rect_attr (str): Name of the sprite rectangle that is indexed (e.g. 'rect', 'hitbox').
+            *sprites: Sprites to add to the group.
+            mobile_types (tuple): Sprite types that move and are re-bucketed by refresh().
+        """
+
+        self.index = SpatialHash(cell_size)
+        self.rect_attr = rect_attr
+        self.mobile_types = mobile_types
+        self.mobile_sprites = set()
+        self.pending_sprites = []  # sprite rects are set after joining the group
+        self.sprite_order = {}     # sprite -> insertion number, keeps results in group order
+        self.next_order = 0
+        self.version = 0           # bumped whenever a sprite enters or leaves the index
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Adds a sprite to the group and queues it for indexing on the next query.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite being added.
+            layer: Unused, kept for pygame compatibility.
+        """
+
+        super().add_internal(sprite, layer)
+        self.pending_sprites.append(sprite)
+        self.sprite_order[sprite] = self.next_order
+        self.next_order += 1
+
+    def remove_internal(self, sprite):
+        """
+        Removes a sprite from the group and from the spatial index.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite being removed.
+        """
+
+        super().remove_internal(sprite)
+        if sprite in self.index:
+            self.index.remove(sprite)
+            self.version += 1
+        self.mobile_sprites.discard(sprite)
+        self.sprite_order.pop(sprite, None)
+
+    def index_pending_sprites(self):
+        """
+        Inserts the sprites added since the last query into the spatial index.
+        """
+
+        for sprite in self.pending_sprites:
+            if sprite in self.spritedict and sprite not in self.index:
+                self.index.insert(sprite, getattr(sprite, self.rect_attr))
+                self.version += 1
+                if getattr(sprite, 'sprite_type', None) in self.mobile_types:
+                    self.mobile_sprites.add(sprite)
+        self.pending_sprites.clear()
+
+    def refresh(self):
+        """
+        Re-buckets the mobile sprites that crossed a cell border since the last refresh.
+        """
+
+        if self.pending_sprites:
+            self.index_pending_sprites()
+
+        rect_attr = self.rect_attr
+        for sprite in self.mobile_sprites:
+            self.index.move(sprite, getattr(sprite, rect_attr))
+
+    def collide(self, rect):
+        """
+        Returns the sprites whose indexed rectangle overlaps the given rectangle,
+        in the order they were added to the group (like pygame.sprite.spritecollide).
+
+        Args:
+            rect (pygame.Rect): Query rectangle in world coordinates.
+
+        Returns:
+            list: Colliding sprites.
+        """
+
+        rect_attr = self.rect_attr
+        hits = [sprite for sprite in self.query(rect) if rect.colliderect(getattr(sprite, rect_attr))]
+        if len(hits) > 1:
+            hits.sort(key=self.sprite_order.__getitem__)
+        return hits
+
+    def query(self, rect):
+        """
+        Returns the sprites whose indexed rectangle may overlap the given rectangle.
+
+        Args:
+            rect (pygame.Rect): Query rectangle in world coordinates.
+
+        Returns:
+            set: Candidate sprites.
+        """
+
+        if self.pending_sprites:
+            self.index_pending_sprites()
+        return self.index.query(rect)
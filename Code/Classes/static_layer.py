@@ -0,0 +1,134 @@
+import pygame
+from Code.Utilities.settings import *
+
+class StaticTileLayer:
+    """
+    Pre-composites static tiles into chunk surfaces at the current zoom.
+    Each chunk is baked once and only re-baked when one of its tiles is removed.
+    """
+
+    def __init__(self, chunk_tiles):
+        """
+        Initializes an empty static layer.
+
+        Args:
+            chunk_tiles (int): Width and height of a chunk, in tiles.
+        """
+
+        self.chunk_size = chunk_tiles * TILESIZE
+        self.zoom_factor = None
+
+        self.chunks = {}       # (chunk_x, chunk_y) -> list of tiles
+        self.tile_chunks = {}  # tile -> (chunk_x, chunk_y)
+        self.baked = {}        # (chunk_x, chunk_y) -> baked surface
+
+    def get_chunk_key(self, tile):
+        """
+        Returns the chunk that contains the tile's top-left corner.
+
+        Args:
+            tile (Tile): Tile to locate.
+
+        Returns:
+            tuple: (chunk_x, chunk_y)
+        """
+
+        return (tile.rect.left // self.chunk_size, tile.rect.top // self.chunk_size)
+
+    def add(self, tile):
+        """
+        Adds a tile to its chunk and marks the chunk for re-baking.
+
+        Args:
+            tile (Tile): Static tile to add.
+        """
+
+        key = self.get_chunk_key(tile)
+        self.chunks.setdefault(key, []).append(tile)
+        self.tile_chunks[tile] = key
+        self.baked.pop(key, None)
+
+    def remove(self, tile):
+        """
+        Removes a tile from the layer and marks only its chunk for re-baking.
+
+        Args:
+            tile (Tile): Tile to remove. Tiles that are not in the layer are ignored.
+        """
+
+        key = self.tile_chunks.pop(tile, None)
+        if key is None:
+            return
+
+        self.chunks[key].remove(tile)
+        if not self.chunks[key]:
+            del self.chunks[key]
+        self.baked.pop(key, None)
+
+    def set_zoom(self, zoom_factor):
+        """
+        Drops every baked chunk when the zoom factor changes.
+
+        Args:
+            zoom_factor (float): Zoom factor the chunks are baked for.
+        """
+
+        if zoom_factor != self.zoom_factor:
+            self.baked.clear()
+            self.zoom_factor = zoom_factor
+
+    def bake_chunk(self, key):
+        """
+        Composites all tiles of a chunk into a single surface at the current zoom.
+
+        Args:
+            key (tuple): (chunk_x, chunk_y) of the chunk to bake.
+
+        Returns:
+            pygame.Surface: Baked chunk surface.
+        """
+
+        zoom = self.zoom_factor
+        chunk_left = key[0] * self.chunk_size
+        chunk_top = key[1] * self.chunk_size
+        size = int(self.chunk_size * zoom) + 1
+
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        for tile in sorted(self.chunks[key], key=lambda t: t.rect.centery):
+            scaled = pygame.transform.scale(
+                tile.image,
+                (int(tile.rect.width * zoom), int(tile.rect.height * zoom))
+            )
+            surface.blit(scaled, (int((tile.rect.left - chunk_left) * zoom),
+                                  int((tile.rect.top - chunk_top) * zoom)))
+
+        self.baked[key] = surface
+        return surface
+
+    def draw(self, surface, camera_world_rect, offset):
+        """
+        Blits the chunks that overlap the camera, baking any that are missing.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+            camera_world_rect (pygame.Rect): Camera rectangle in world coordinates.
+            offset (pygame.math.Vector2): Camera offset in world coordinates.
+        """
+
+        zoom = self.zoom_factor
+        first_x = camera_world_rect.left // self.chunk_size
+        last_x = camera_world_rect.right // self.chunk_size
+        first_y = camera_world_rect.top // self.chunk_size
+        last_y = camera_world_rect.bottom // self.chunk_size
+
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                key = (chunk_x, chunk_y)
+                if key not in self.chunks:
+                    continue
+
+                baked = self.baked.get(key)
+                if baked is None:
+                    baked = self.bake_chunk(key)
+                surface.blit(baked, (int((chunk_x * self.chunk_size - offset.x) * zoom),
+                                     int((chunk_y * self.chunk_size - offset.y) * zoom)))
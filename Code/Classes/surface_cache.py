@@ -0,0 +1,65 @@
+from collections import OrderedDict
+
+import pygame
+
+class ScaledSurfaceCache:
+    """
+    Bounded LRU cache of scaled surfaces, keyed by source surface and target size.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of scaled surfaces kept before evicting the least recently used.
+        """
+
+        self.max_size = max_size
+        self.zoom_factor = None
+        self.entries = OrderedDict()
+
+    def set_zoom(self, zoom_factor):
+        """
+        Invalidates every cached surface when the zoom factor changes.
+
+        Args:
+            zoom_factor (float): Zoom factor the cached surfaces are scaled for.
+        """
+
+        if zoom_factor != self.zoom_factor:
+            self.entries.clear()
+            self.zoom_factor = zoom_factor
+
+    def get(self, surface, size):
+        """
+        Returns the surface scaled to the given size, scaling it only on a cache miss.
+
+        Args:
+            surface (pygame.Surface): Source surface.
+            size (tuple): (width, height) of the scaled surface.
+
+        Returns:
+            pygame.Surface: Scaled surface.
+        """
+
+        key = (surface, size)
+        scaled = self.entries.get(key)
+
+        if scaled is not None:
+            self.entries.move_to_end(key)
+            return scaled
+
+        scaled = pygame.transform.scale(surface, size)
+        self.entries[key] = scaled
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+        return scaled
+
+    def clear(self):
+        """
+        Removes every cached surface.
+        """
+
+        self.entries.clear()
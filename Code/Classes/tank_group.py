@@ -0,0 +1,78 @@
+from Code.Utilities.settings import *
+from Code.Classes.spatial_hash import SpatialGroup
+
+class TankGroup(SpatialGroup):
+    """
+    Spatial group of every tank (players and enemies), indexed by hitbox.
+    Tanks that join it get a reference to it and are kept apart by separate().
+    """
+
+    def __init__(self, *sprites):
+        """
+        Initializes the group with tile-sized hash cells.
+
+        Args:
+            *sprites: Tanks to add to the group.
+        """
+
+        super().__init__(TILESIZE, 'hitbox', *sprites, mobile_types=('player', 'enemy'))
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Adds a tank to the group and links the group to it.
+
+        Args:
+            sprite (Entity): Tank being added.
+            layer: Unused, kept for pygame compatibility.
+        """
+
+        super().add_internal(sprite, layer)
+        sprite.tank_sprites = self
+
+    def remove_internal(self, sprite):
+        """
+        Removes a tank from the group and unlinks it.
+
+        Args:
+            sprite (Entity): Tank being removed.
+        """
+
+        super().remove_internal(sprite)
+        if getattr(sprite, 'tank_sprites', None) is self:
+            sprite.tank_sprites = None
+
+    def separate(self, sprite, axis):
+        """
+        Pushes a moving tank out of the neighbor tanks it ran into along one axis.
+        Only the tanks in the hash cells around its hitbox are tested.
+
+        Args:
+            sprite (Entity): Tank that just moved.
+            axis (str): 'horizontal' or 'vertical'.
+        """
+
+        if self.pending_sprites:
+            self.index_pending_sprites()
+
+        hitbox = sprite.hitbox
+        direction = sprite.direction
+        self.index.move(sprite, hitbox)
+
+        for other in self.index.query(hitbox):
+            if other is sprite or not other.hitbox.colliderect(hitbox):
+                continue
+
+            # Only block movement towards the other tank, so overlapping tanks can still drive apart
+            other_hitbox = other.hitbox
+            if axis == 'horizontal':
+                if direction.x > 0 and other_hitbox.centerx >= hitbox.centerx: # moving right
+                    hitbox.right = other_hitbox.left
+                if direction.x < 0 and other_hitbox.centerx <= hitbox.centerx: # moving left
+                    hitbox.left = other_hitbox.right
+            else:
+                if direction.y > 0 and other_hitbox.centery >= hitbox.centery: # moving down
+                    hitbox.bottom = other_hitbox.top
+                if direction.y < 0 and other_hitbox.centery <= hitbox.centery: # moving up
+                    hitbox.top = other_hitbox.bottom
+
+        self.index.move(sprite, hitbox)
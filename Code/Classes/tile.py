@@ -27,6 +27,7 @@ class Tile(pygame.sprite.Sprite):
         super().__init__(groups)
 
         self.sprite_type = sprite_type
+        self.collision_layer = COLLISION_LAYERS.get(sprite_type, 0)
         self.image = surface
 
         self.rect = self.image.get_rect(topleft=pos)
@@ -0,0 +1,148 @@
+from Code.Utilities.settings import *
+from Code.Classes.spatial_hash import SpatialGroup
+
+class TileGrid:
+    """
+    Occupancy grid of obstacle hitboxes, stored per map cell.
+    Collisions are resolved by looking up only the cells a hitbox spans.
+    """
+
+    def __init__(self, cols, rows, tile_size=TILESIZE):
+        """
+        Initializes an empty grid.
+
+        Args:
+            cols (int): Number of columns of the map.
+            rows (int): Number of rows of the map.
+            tile_size (int): Size of a cell in pixels.
+        """
+
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+        self.cells = [() for _ in range(cols * rows)]  # flat index -> tuple of hitboxes
+
+    def spanned_cells(self, rect):
+        """
+        Returns the flat indexes of the grid cells a rectangle spans.
+
+        Args:
+            rect (pygame.Rect): Rectangle in world coordinates.
+
+        Returns:
+            list: Flat cell indexes inside the map.
+        """
+
+        size = self.tile_size
+        first_col = max(rect.left // size, 0)
+        first_row = max(rect.top // size, 0)
+        last_col = min(max(rect.left, rect.right - 1) // size, self.cols - 1)
+        last_row = min(max(rect.top, rect.bottom - 1) // size, self.rows - 1)
+
+        return [row * self.cols + col
+                for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def add(self, hitbox):
+        """
+        Marks the cells spanned by an obstacle hitbox (already padded by Tile) as occupied.
+
+        Args:
+            hitbox (pygame.Rect): Obstacle hitbox.
+        """
+
+        for index in self.spanned_cells(hitbox):
+            self.cells[index] = self.cells[index] + (hitbox,)
+
+    def remove(self, hitbox):
+        """
+        Clears an obstacle hitbox from the cells it spans.
+
+        Args:
+            hitbox (pygame.Rect): Hitbox previously passed to add().
+        """
+
+        for index in self.spanned_cells(hitbox):
+            self.cells[index] = tuple(h for h in self.cells[index] if h is not hitbox)
+
+    def resolve(self, hitbox, direction, axis):
+        """
+        Pushes a moving hitbox out of the obstacles in the cells it spans,
+        matching the sprite-based resolution in Entity.collision.
+
+        Args:
+            hitbox (pygame.Rect): Moving hitbox, modified in place.
+            direction (pygame.math.Vector2): Movement direction.
+            axis (str): 'horizontal' or 'vertical'.
+        """
+
+        cells = self.cells
+        for index in self.spanned_cells(hitbox):
+            for obstacle in cells[index]:
+                if obstacle.colliderect(hitbox):
+                    if axis == 'horizontal':
+                        if direction.x > 0: # moving right
+                            hitbox.right = obstacle.left
+                        if direction.x < 0: # moving left
+                            hitbox.left = obstacle.right
+                    else:
+                        if direction.y > 0: # moving down
+                            hitbox.bottom = obstacle.top
+                        if direction.y < 0: # moving up
+                            hitbox.top = obstacle.bottom
+
+
+class ObstacleGroup(SpatialGroup):
+    """
+    Obstacle sprite group that also keeps a TileGrid of the obstacle hitboxes in sync.
+    """
+
+    def __init__(self, cols, rows, *sprites):
+        """
+        Initializes the group, its spatial hash and its tile grid.
+
+        Args:
+            cols (int): Number of columns of the map.
+            rows (int): Number of rows of the map.
+            *sprites: Sprites to add to the group.
+        """
+
+        self.grid = TileGrid(cols, rows)
+        super().__init__(TILESIZE, 'hitbox', *sprites)
+
+    def remove_internal(self, sprite):
+        """
+        Removes a sprite from the group, the spatial hash and the tile grid.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite being removed.
+        """
+
+        if sprite in self.index:
+            self.grid.remove(sprite.hitbox)
+        super().remove_internal(sprite)
+
+    def index_pending_sprites(self):
+        """
+        Inserts the sprites added since the last query into the spatial hash and the tile grid.
+        """
+
+        for sprite in self.pending_sprites:
+            if sprite in self.spritedict and sprite not in self.index:
+                self.index.insert(sprite, sprite.hitbox)
+                self.grid.add(sprite.hitbox)
+        self.pending_sprites.clear()
+
+    def resolve_collision(self, hitbox, direction, axis):
+        """
+        Resolves a moving hitbox against the tile grid.
+
+        Args:
+            hitbox (pygame.Rect): Moving hitbox, modified in place.
+            direction (pygame.math.Vector2): Movement direction.
+            axis (str): 'horizontal' or 'vertical'.
+        """
+
+        if self.pending_sprites:
+            self.index_pending_sprites()
+        self.grid.resolve(hitbox, direction, axis)
@@ -0,0 +1,96 @@
+from Code.Functions.A_star import is_walkable
+
+class WalkableGrid:
+    """
+    Flat walkability array of the route matrix, padded with a non-walkable border
+    so neighbor lookups need no bounds checks.
+    """
+
+    def __init__(self, matrix):
+        """
+        Builds the grid with the same is_walkable predicate used by a_star().
+
+        Args:
+            matrix (list): 2D map matrix of strings.
+        """
+
+        self.rows = len(matrix)
+        self.cols = len(matrix[0]) if self.rows else 0
+        self.stride = self.cols + 2
+        self.cells = bytearray(self.stride * (self.rows + 2))
+        self.version = 0
+
+        for y in range(self.rows):
+            for x in range(self.cols):
+                if is_walkable(matrix, x, y):
+                    self.cells[self.index(x, y)] = 1
+
+        # Same neighbor order as get_adjacent_coords: right, left, down, up
+        self.neighbor_offsets = ((1, 0, 1), (-1, 0, -1), (0, 1, self.stride), (0, -1, -self.stride))
+
+    @classmethod
+    def from_cells(cls, cells, cols, rows):
+        """
+        Wraps an existing padded cell buffer, e.g. the shared copy read by the pathfinding workers.
+
+        Args:
+            cells: Buffer laid out like WalkableGrid.cells (bytearray or memoryview).
+            cols (int): Columns of the map.
+            rows (int): Rows of the map.
+
+        Returns:
+            WalkableGrid: Grid reading the given buffer.
+        """
+
+        grid = cls.__new__(cls)
+        grid.rows = rows
+        grid.cols = cols
+        grid.stride = cols + 2
+        grid.cells = cells
+        grid.version = 0
+        grid.neighbor_offsets = ((1, 0, 1), (-1, 0, -1), (0, 1, grid.stride), (0, -1, -grid.stride))
+        return grid
+
+    def index(self, x, y):
+        """
+        Returns the flat index of a cell.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            int: Index in cells.
+        """
+
+        return (y + 1) * self.stride + x + 1
+
+    def contains(self, x, y):
+        """
+        Checks if a cell is inside the map.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            bool: True if the cell is inside the map.
+        """
+
+        return 0 <= x < self.cols and 0 <= y < self.rows
+
+    def set_walkable(self, x, y, walkable):
+        """
+        Updates one cell, e.g. when a wall is destroyed.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            walkable (bool): New state of the cell.
+        """
+
+        if self.contains(x, y):
+            index = self.index(x, y)
+            if self.cells[index] != walkable:
+                self.cells[index] = 1 if walkable else 0
+                self.version += 1
@@ -1,9 +1,39 @@
 import pygame
 from Code.Utilities.settings import *
 from Code.Entities.Explosion import Explosion
+from Code.Functions.support import get_bullet_image
+
+def aim_bullet(entity, rect, direction):
+    """
+    Places a bullet rect in front of the entity firing it, following the entity's status.
+
+    Args:
+        entity: The entity firing the bullet (player or enemy).
+        rect (pygame.Rect): Bullet rect, moved in place.
+        direction (pygame.math.Vector2): Bullet direction, updated in place.
+    """
+
+    facing = entity.status.split('_')[0]
+    offset = 10
+
+    if facing == 'right':
+        rect.midleft = entity.rect.midright + pygame.math.Vector2(offset, 0)
+        direction.update(1, 0)
+    elif facing == 'left':
+        rect.midright = entity.rect.midleft - pygame.math.Vector2(offset, 0)
+        direction.update(-1, 0)
+    elif facing == 'up':
+        rect.midbottom = entity.rect.midtop - pygame.math.Vector2(0, offset)
+        direction.update(0, -1)
+    elif facing == 'down':
+        rect.midtop = entity.rect.midbottom + pygame.math.Vector2(0, offset)
+        direction.update(0, 1)
+    else:
+        rect.center = entity.rect.center
+        direction.update(0, 0)
 
 class Bullet(pygame.sprite.Sprite):
-    def __init__(self, entity, tile_sprites, groups, bullet_speed, all_sprites_group=None):
+    def __init__(self, entity, tile_sprites, groups, bullet_speed, all_sprites_group=None, pool=None):
         """
         Initializes a bullet object.
 
@@ -13,43 +43,70 @@ class Bullet(pygame.sprite.Sprite):
             groups: Sprite groups to add this bullet to.
             bullet_speed (float): Speed of the bullet.
             all_sprites_group: Optional group for explosion effect.
+            pool (BulletPool): Optional pool the bullet returns to when it is killed.
         """
                 
-        super().__init__(groups)
+        super().__init__()
 
         self.sprite_type = 'bullet'
-        self.origin_type = entity.sprite_type
-        self.all_sprites_group = all_sprites_group
-        
-        direction = entity.status.split('_')[0]
+        self.pool = pool
 
-        self.image = pygame.image.load('Assets/Entities/Bullet/bullet.png').convert_alpha() 
-        self.image = pygame.transform.scale(self.image, (25, 25))
+        # Shared pre-scaled image, loaded once by load_all_assets
+        self.image = get_bullet_image()
 
         self.rect = self.image.get_rect()
+        self.direction = pygame.math.Vector2()
+        self.previous_rect = self.rect.copy()
+        self.swept_rect = self.rect.copy()
+        self.world_rect = pygame.Rect(WORLD_RECT)
+
+        self.reset(entity, tile_sprites, bullet_speed, all_sprites_group)
+        self.add(groups)
+
+    def reset(self, entity, tile_sprites, bullet_speed, all_sprites_group=None):
+        """
+        Places the bullet in front of the entity firing it. Used on creation and when
+        a pooled bullet is fired again, so no surface is allocated.
+
+        Args:
+            entity: The entity firing the bullet (player or enemy).
+            tile_sprites: Group of tile sprites for collision.
+            bullet_speed (float): Speed of the bullet.
+            all_sprites_group: Optional group for explosion effect.
+        """
+
+        self.origin_type = entity.sprite_type
+        self.origin_layer = COLLISION_LAYERS.get(self.origin_type, 0)
+        self.collision_mask = BULLET_MASKS.get(self.origin_type, 0)
+        self.all_sprites_group = all_sprites_group
+
+        # A recycled bullet is a new entity for the network snapshot
+        if hasattr(self, 'network_id'):
+            del self.network_id
         
-        offset = 10
         self.bullet_speed = bullet_speed
-
-        if direction == 'right':
-            self.rect.midleft = entity.rect.midright + pygame.math.Vector2(offset, 0)
-            self.direction = pygame.math.Vector2(1, 0)
-        elif direction == 'left':
-            self.rect.midright = entity.rect.midleft - pygame.math.Vector2(offset, 0)
-            self.direction = pygame.math.Vector2(-1, 0)
-        elif direction == 'up':
-            self.rect.midbottom = entity.rect.midtop - pygame.math.Vector2(0, offset)
-            self.direction = pygame.math.Vector2(0, -1)
-        elif direction == 'down':
-            self.rect.midtop = entity.rect.midbottom + pygame.math.Vector2(0, offset)
-            self.direction = pygame.math.Vector2(0, 1)
-        else:
-            self.rect.center = entity.rect.center
-            self.direction = pygame.math.Vector2(0, 0)
+        aim_bullet(entity, self.rect, self.direction)
 
         self.speed = self.bullet_speed 
         self.tile_sprites = tile_sprites
 
+        # Area covered since the last collision check, used for swept collisions
+        self.start_sweep()
+
+        # Lifecycle: bullets that hit nothing are removed out of range or out of the world
+        self.distance_travelled = 0
+        self.max_range = BULLET_MAX_RANGE
+
+    def kill(self):
+        """
+        Removes the bullet from all groups and returns it to its pool.
+        """
+
+        if self.alive():
+            super().kill()
+            if self.pool is not None:
+                self.pool.release(self)
+
     def explode_and_kill(self):
         """
         Creates an explosion effect and removes the bullet from all groups.
@@ -62,7 +119,35 @@ class Bullet(pygame.sprite.Sprite):
     def update(self):
         """
         Updates the bullet's position based on its direction and speed.
+        The bullet is removed without exploding once it exceeds its range or leaves the world.
         """
 
         self.rect.x += self.direction.x * self.speed
         self.rect.y += self.direction.y * self.speed
+        self.swept_rect.union_ip(self.rect)
+
+        self.distance_travelled += self.speed
+        if self.distance_travelled > self.max_range or not self.world_rect.colliderect(self.rect):
+            self.kill()
+
+    def start_sweep(self):
+        """
+        Starts a new sweep at the current position, once the travelled path has been checked.
+        Bullets are updated by more than one group per frame, so the sweep spans every step since the last check.
+        """
+
+        self.previous_rect.update(self.rect)
+        self.swept_rect.update(self.rect)
+
+    def move_to_contact(self, distance):
+        """
+        Places the bullet where it first touched a target since the start of the sweep.
+
+        Args:
+            distance (int): Pixels travelled from the start of the sweep.
+        """
+
+        self.rect.topleft = (
+            self.previous_rect.x + self.direction.x * distance,
+            self.previous_rect.y + self.direction.y * distance,
+        )
@@ -6,10 +6,10 @@ from Code.Functions.A_star import a_star
 from Code.Utilities.settings import *
 from Code.Entities.entity import Entity
 from Code.Functions.support import import_folder
-from Code.Functions.support import ASSET_CACHE
+from Code.Functions.support import ASSET_CACHE, get_effect_variant
 
 class Enemy(Entity):
-    def __init__(self, enemy_name, pos, groups, obstacle_sprites, create_bullet, player, structure, matrix_route, path_request):
+    def __init__(self, enemy_name, pos, groups, obstacle_sprites, create_bullet, player, structure, matrix_route, path_request, line_of_sight=None, players=None):
         """
         Initialize an Enemy sprite.
 
@@ -23,17 +23,22 @@ class Enemy(Entity):
             structure (Structure): Reference to the structure/base object.
             matrix_route (list): Matrix for pathfinding.
             path_request (object): Object to request paths for movement.
+            line_of_sight (LineOfSight): Optional service checked before firing at the player.
+            players (list): Every player the enemy may chase (shared with the level), defaults to [player].
         """
 
         super().__init__(groups)
 
         self.sprite_type = 'enemy'
+        self.collision_layer = LAYER_ENEMY
         
 
         self.status = 'down_idle'
         self.animations = {} 
 
         self.player = player
+        self.players = players if players is not None else [player]
+        self.chased_player = player  # nearest player, updated every frame
         self.structure_pos = structure.get_grid_position()
         self.matrix_route = matrix_route
 
@@ -78,10 +83,12 @@ class Enemy(Entity):
 
         # attack setup 
         self.create_bullet = create_bullet
+        self.line_of_sight = line_of_sight
 
         # Rute for the path
         self.path_request = path_request  
         self.path = []
+        self.path_future = None  # pending asynchronous path request
 
         # state lock
         self.state_locked = False  # Locks state changes after attacking
@@ -90,7 +97,7 @@ class Enemy(Entity):
 
         # slow motion state control
         self.slow_motion_applied = False
-        self.clock_image = pygame.image.load("Assets/Effects/Clock/Clock_effect.png").convert_alpha()
+        self.clock_image = ASSET_CACHE['clock_effect']
 
         # pathfinding cache
         self.last_target = None
@@ -151,6 +158,25 @@ class Enemy(Entity):
 
         return (distance, direction)
     
+    def get_chased_player(self):
+        """
+        Returns the player the enemy goes after: the nearest one within notice_radius,
+        or the main player if none is close enough.
+
+        Returns:
+            Player: Player to chase.
+        """
+
+        chased = self.player
+        best_distance, _ = self.get_player_distance_direction(self.player)
+        for player in self.players:
+            if player is not self.player and player.alive():
+                distance, _ = self.get_player_distance_direction(player)
+                if distance <= self.notice_radius and distance < best_distance:
+                    chased = player
+                    best_distance = distance
+        return chased
+
     def get_structure_distance_direction(self):
         """
         Calculates the distance and normalized direction vector from the enemy to the structure/base.
@@ -176,6 +202,7 @@ class Enemy(Entity):
     def request_path(self, matrix_route, target_pos, enemy_pos):
         """
         Requests a new path to the target if the target changed or enough time has passed.
+        The search runs asynchronously: the enemy keeps its current path until the new one arrives.
 
         Args:
             matrix_route (list): Pathfinding matrix.
@@ -184,12 +211,54 @@ class Enemy(Entity):
         """
 
         current_time = pygame.time.get_ticks()
-        if (self.last_target != target_pos or
+        if self.path_future is None and (self.last_target != target_pos or
             current_time - self.last_path_time >= self.path_refresh_rate):
             
-            self.path = self.path_request.solicitar_ruta(matrix_route, target_pos, enemy_pos)
+            self.path_future = self.path_request.solicitar_ruta_async(matrix_route, target_pos, enemy_pos)
             self.last_target = target_pos
             self.last_path_time = current_time
+
+        if self.path_future is not None and self.path_future.done():
+            ruta = self.path_request.get_path_result(self.path_future)
+            self.path_future = None
+
+            if not ruta:
+                self.path = ruta
+                return
+
+            # The search started from the cell of the enemy when it was submitted: resume the
+            # path at the current cell, or keep the old path if the enemy already left it
+            cells = [tuple(step) for step in ruta]
+            current_cell = tuple(enemy_pos)
+            if current_cell in cells:
+                self.path = ruta[cells.index(current_cell):]
+        
+    def follow_flow_field(self, enemy_pos, field, target):
+        """
+        Takes the next step toward a target from a shared flow field.
+
+        Args:
+            enemy_pos (list): Enemy grid position.
+            field (FlowField): Field toward the target.
+            target: Structure cell or player being followed, used to drop the path when it changes.
+        """
+
+        if self.last_target != target:
+            self.path = []
+            self.last_target = target
+
+        if not self.path:
+            cell = tuple(enemy_pos)
+            next_step = field.next_step(cell)
+            if next_step is None and cell != field.goal:
+                return  # target unreachable, the enemy wanders
+
+            # Like an A* path, start from the center of the current cell to stay aligned with the grid
+            cell_center = (cell[0] * TILESIZE + TILESIZE // 2, cell[1] * TILESIZE + TILESIZE // 2)
+            if abs(self.hitbox.centerx - cell_center[0]) > 1 or abs(self.hitbox.centery - cell_center[1]) > 1:
+                self.path.append(cell)
+            if next_step is not None:
+                self.path.append(next_step)
         
     def get_status(self, player):
         """
@@ -206,7 +275,7 @@ class Enemy(Entity):
                 distance, direction = self.get_structure_distance_direction()
 
             # ataque
-            if distance <= self.attack_radius and self.can_attack:
+            if distance <= self.attack_radius and self.can_attack and self.has_line_of_sight(player):
                 if self.status != 'attack':
                     self.frame_index = 0
                 self.status = 'attack'
@@ -224,6 +293,37 @@ class Enemy(Entity):
                 self.path = []
 
 
+    def has_line_of_sight(self, player):
+        """
+        Checks that no wall, grass, rock or barrier stands in the lane the bullet will fly along.
+        Enemies fire straight along the dominant axis (see actions), so the ray follows the
+        enemy's row or column up to the player's column or row.
+        Fire at the structure is not checked, so enemies can still breach walls.
+
+        Args:
+            player (Player): Reference to the player object.
+
+        Returns:
+            bool: True if the enemy may fire at its current target.
+        """
+
+        if self.target != "player" or self.line_of_sight is None:
+            return True
+
+        enemy_cell = (self.rect.centerx // TILESIZE, self.rect.centery // TILESIZE)
+        player_cell = (player.rect.centerx // TILESIZE, player.rect.centery // TILESIZE)
+
+        _, direction = self.get_player_distance_direction(player)
+        if abs(direction.y) > abs(direction.x):
+            lane_end = (enemy_cell[0], player_cell[1])
+        else:
+            lane_end = (player_cell[0], enemy_cell[1])
+
+        # Off the player's cell, the end of the lane is crossed by the bullet too
+        if lane_end != player_cell and self.line_of_sight.is_blocked(lane_end):
+            return False
+        return self.line_of_sight.is_clear(enemy_cell, lane_end)
+
     def actions(self, player):
         """
         Performs actions based on the current status (attack, move, idle).
@@ -291,20 +391,14 @@ class Enemy(Entity):
                 self.can_attack = False
             self.frame_index = 0
 
-        base_image = animation[int(self.frame_index)].copy()
-        self.rect = base_image.get_rect(center=self.hitbox.center)
+        frame = animation[int(self.frame_index)]
+        self.rect = frame.get_rect(center=self.hitbox.center)
 
-        if self.slow_motion_applied:
-            closk_scaled = pygame.transform.scale(self.clock_image, base_image.get_size())
-            base_image.blit(closk_scaled, (0, 0))
-
-        if not self.vulnerable:
-            alpha = self.wave_value()
-            base_image.set_alpha(alpha) 
-        else:
-            base_image.set_alpha(255)
+        overlay = self.clock_image if self.slow_motion_applied else None
+        alpha = self.wave_value() if not self.vulnerable else 255
 
-        self.image = base_image
+        # Each frame/effect combination is built once and reused
+        self.image = get_effect_variant(frame, (), overlay, alpha)
 
 
     def cooldowns(self):
@@ -494,13 +588,23 @@ class Enemy(Entity):
             self.animate()
             return 
 
-        distance_to_player, _ = self.get_player_distance_direction(self.player)
+        self.chased_player = self.get_chased_player()
+        distance_to_player, _ = self.get_player_distance_direction(self.chased_player)
         enemyPos = self.get_grid_position()
 
         if distance_to_player <= self.notice_radius:
-            playerPos = self.player.get_grid_position()
-            self.request_path(self.matrix_route, playerPos, enemyPos)
+            if PLAYER_FLOW_FIELDS:
+                field = self.path_request.get_player_field(self.matrix_route[0], self.chased_player)
+                self.follow_flow_field(enemyPos, field, self.chased_player)
+            else:
+                playerPos = self.chased_player.get_grid_position()
+                self.request_path(self.matrix_route, playerPos, enemyPos)
             self.target = "player"
+        elif FORTRESS_FLOW_FIELD:
+            structure_pos = tuple(self.structure_pos)
+            field = self.path_request.get_flow_field(self.matrix_route[0], structure_pos)
+            self.follow_flow_field(enemyPos, field, structure_pos)
+            self.target = "structure"
         else:
             self.request_path(self.matrix_route, self.structure_pos, enemyPos)
             self.target = "structure"
@@ -533,6 +637,9 @@ class Enemy(Entity):
         if self.player and not self.player.is_local:
             return
 
+        # In multiplayer the enemy fights the player it is chasing
+        player = self.chased_player
+
         self.get_status(player)
         self.check_death()
         self.actions(player)
\ No newline at end of file
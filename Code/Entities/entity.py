@@ -1,5 +1,6 @@
 import pygame
 from math import sin
+from Code.Utilities.settings import *
 
 class Entity(pygame.sprite.Sprite):
 	def __init__(self,groups):
@@ -10,6 +11,7 @@ class Entity(pygame.sprite.Sprite):
             groups (list): Sprite groups to add this entity to.
         """
 
+		self.tank_sprites = None  # set by TankGroup when the entity joins it
 		super().__init__(groups)
 		self.frame_index = 0
 		self.animation_speed = 0.15
@@ -36,12 +38,30 @@ class Entity(pygame.sprite.Sprite):
 		"""
         Handles collision detection and resolution for the entity.
 
+        Args:
+            direction (str): 'horizontal' or 'vertical' axis for collision.
+        """
+
+		# Direct lookup of the tile grid cells spanned by the hitbox
+		if COLLISION_MODE == 'grid':
+			self.obstacle_sprites.resolve_collision(self.hitbox, self.direction, direction)
+		else:
+			self.obstacle_collision(direction)
+
+		# Other tanks, found through the neighbor query of the tank spatial hash
+		if self.tank_sprites is not None:
+			self.tank_sprites.separate(self, direction)
+
+	def obstacle_collision(self,direction):
+		"""
+        Resolves the hitbox against the obstacles in the spatial hash cells around it.
+
         Args:
             direction (str): 'horizontal' or 'vertical' axis for collision.
         """
 
 		if direction == 'horizontal':
-			for sprite in self.obstacle_sprites:
+			for sprite in self.obstacle_sprites.query(self.hitbox):
 				if sprite.hitbox.colliderect(self.hitbox):
 					if self.direction.x > 0: # moving right
 						self.hitbox.right = sprite.hitbox.left
@@ -49,7 +69,7 @@ class Entity(pygame.sprite.Sprite):
 						self.hitbox.left = sprite.hitbox.right
 
 		if direction == 'vertical':
-			for sprite in self.obstacle_sprites:
+			for sprite in self.obstacle_sprites.query(self.hitbox):
 				if sprite.hitbox.colliderect(self.hitbox):
 					if self.direction.y > 0: # moving down
 						self.hitbox.bottom = sprite.hitbox.top
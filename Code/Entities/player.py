@@ -2,7 +2,7 @@ import pygame
 from Code.Entities.entity import Entity
 from Code.Utilities.settings import *
 from Code.Functions.support import import_folder
-from Code.Functions.support import ASSET_CACHE
+from Code.Functions.support import ASSET_CACHE, get_effect_variant
 
 class Player(Entity):
     def __init__(self, pos, groups, obstacle_sprites, create_bullet, is_local=True):
@@ -20,6 +20,7 @@ class Player(Entity):
         self.is_local = is_local
 
         self.sprite_type = 'player'
+        self.collision_layer = LAYER_PLAYER
         
         self.status = 'up'
 
@@ -59,7 +60,7 @@ class Player(Entity):
         # Power-ups setup
         self.shield_active = False
         self.shield_end_time = 0
-        self.shield_image = pygame.image.load("Assets/Effects/Shield/Shield.png").convert_alpha()
+        self.shield_image = ASSET_CACHE['shield_effect']
 
         # duration time of power-ups
         self.shield_duration = 0
@@ -168,31 +169,26 @@ class Player(Entity):
         if self.frame_index >= len(animation):
             self.frame_index = 0
 
-        # Reset base image on each frame
-        base_image = animation[int(self.frame_index)].copy()
-        self.rect = base_image.get_rect(center=self.hitbox.center)
+        frame = animation[int(self.frame_index)]
+        self.rect = frame.get_rect(center=self.hitbox.center)
 
+        tints = []
         # Damage shoot boost → red
         if self.shoot_upgrade_active:
-            base_image.fill((255, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
+            tints.append((255, 0, 0))
         
         # Machine gun → orange
         if self.machine_gun_active:
-            base_image.fill((255, 155, 0), special_flags=pygame.BLEND_RGB_ADD)
+            tints.append((255, 155, 0))
 
         # Shield → overlay
-        if self.shield_active:
-            shield_scaled = pygame.transform.scale(self.shield_image, base_image.get_size())
-            base_image.blit(shield_scaled, (0, 0))
+        overlay = self.shield_image if self.shield_active else None
 
         # Blinking when taking damage
-        if not self.vulnerable:
-            alpha = self.wave_value()
-            base_image.set_alpha(alpha)
-        else:
-            base_image.set_alpha(255)
+        alpha = self.wave_value() if not self.vulnerable else 255
 
-        self.image = base_image
+        # Each frame/effect combination is built once and reused
+        self.image = get_effect_variant(frame, tuple(tints), overlay, alpha)
 
 
     def return_damage(self):
@@ -104,4 +104,68 @@ def a_star(jugador, enemigo, matrix):
                 f_score[vecino] = tentative_g + manhattan_distance(vecino, enemigo)
                 heapq.heappush(open_set, (f_score[vecino], vecino))
 
-    return None
\ No newline at end of file
+    return None
+
+def a_star_grid(jugador, enemigo, grid, explored=None):
+    """
+    A* over a WalkableGrid with flat indexes, array g-scores and a closed set.
+    Ties are broken by (f, x, y) like a_star(), so both return the same paths.
+
+    Args:
+        jugador (tuple): Start position (usually player).
+        enemigo (tuple): Goal position (usually enemy).
+        grid (WalkableGrid): Precomputed walkability of the map.
+        explored (list): Optional list that receives the flat index of every expanded cell.
+
+    Returns:
+        list or None: List of coordinates for the path, or None if no path found.
+    """
+
+    start_x, start_y = jugador
+    goal_x, goal_y = enemigo
+    start = grid.index(start_x, start_y)
+    goal = grid.index(goal_x, goal_y)
+
+    cells = grid.cells
+    offsets = grid.neighbor_offsets
+    size = len(cells)
+    g_score = [size] * size  # any path is shorter than the number of cells
+    came_from = [-1] * size
+    closed = bytearray(size)
+
+    g_score[start] = 0
+    open_set = [(abs(start_x - goal_x) + abs(start_y - goal_y), start_x, start_y, start)]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    while open_set:
+        _, x, y, current = heappop(open_set)
+
+        if current == goal:
+            stride = grid.stride
+            ruta = []
+            while current != -1:
+                ruta.append((current % stride - 1, current // stride - 1))
+                current = came_from[current]
+            ruta.reverse()
+            return ruta
+
+        if closed[current]:
+            continue
+        closed[current] = 1
+        if explored is not None:
+            explored.append(current)
+
+        tentative_g = g_score[current] + 1
+        for dx, dy, offset in offsets:
+            vecino = current + offset
+            if not cells[vecino] or tentative_g >= g_score[vecino]:
+                continue
+
+            came_from[vecino] = current
+            g_score[vecino] = tentative_g
+            nx = x + dx
+            ny = y + dy
+            heappush(open_set, (tentative_g + abs(nx - goal_x) + abs(ny - goal_y), nx, ny, vecino))
+
+    return None
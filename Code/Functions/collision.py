@@ -0,0 +1,48 @@
+def entry_distance(start_rect, direction, target_rect):
+    """
+    Returns how far a rectangle travels along an axis-aligned direction before touching a target.
+
+    Args:
+        start_rect (pygame.Rect): Rectangle at the start of the movement.
+        direction (pygame.math.Vector2): Movement direction (one axis only).
+        target_rect (pygame.Rect): Rectangle of the target.
+
+    Returns:
+        int: Distance in pixels, 0 if they already overlap or the rect is not moving.
+    """
+
+    if direction.x > 0:
+        distance = target_rect.left - start_rect.right
+    elif direction.x < 0:
+        distance = start_rect.left - target_rect.right
+    elif direction.y > 0:
+        distance = target_rect.top - start_rect.bottom
+    elif direction.y < 0:
+        distance = start_rect.top - target_rect.bottom
+    else:
+        distance = 0
+    return max(distance, 0)
+
+def sweep_hits(start_rect, swept_rect, direction, candidates, get_rect):
+    """
+    Returns the candidates touched by a rectangle moving from start_rect across swept_rect,
+    ordered by the distance travelled before the contact (first hit first).
+
+    Args:
+        start_rect (pygame.Rect): Rectangle at the start of the movement.
+        swept_rect (pygame.Rect): Area covered by the whole movement.
+        direction (pygame.math.Vector2): Movement direction (one axis only).
+        candidates (iterable): Sprites returned by the broad phase.
+        get_rect (callable): Returns the rectangle used for a candidate.
+
+    Returns:
+        list: (distance, sprite) tuples sorted by distance; ties keep the candidates order.
+    """
+
+    hits = []
+    for sprite in candidates:
+        rect = get_rect(sprite)
+        if swept_rect.colliderect(rect):
+            hits.append((entry_distance(start_rect, direction, rect), sprite))
+    hits.sort(key=lambda hit: hit[0])
+    return hits
@@ -0,0 +1,43 @@
+from Code.Functions.A_star import a_star_grid
+from Code.Classes.walkable_grid import WalkableGrid
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8, PathRequest stays synchronous
+    shared_memory = None
+
+# Estado de cada proceso del pool, creado por attach_grid
+worker_memory = None
+worker_grid = None
+
+def attach_grid(name, size, cols, rows):
+    """
+    Pool initializer: maps the walkability grid shared by PathRequest.
+    The grid is read in place, so destroyed tiles are seen without resending the map.
+
+    Args:
+        name (str): Name of the shared memory block.
+        size (int): Number of cells of the padded grid.
+        cols (int): Columns of the map.
+        rows (int): Rows of the map.
+    """
+
+    global worker_memory, worker_grid
+    worker_memory = shared_memory.SharedMemory(name=name)
+    worker_grid = WalkableGrid.from_cells(worker_memory.buf[:size], cols, rows)
+
+def search_path(start, goal):
+    """
+    Runs a grid A* search inside a worker process.
+
+    Args:
+        start (tuple): (x, y) start cell.
+        goal (tuple): (x, y) goal cell.
+
+    Returns:
+        tuple: (path or None, list of expanded cell indexes) for the path cache.
+    """
+
+    explored = []
+    ruta = a_star_grid(start, goal, worker_grid, explored)
+    return ruta, explored
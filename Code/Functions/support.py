@@ -6,6 +6,7 @@ import random
 from Code.Utilities.settings import tanks_data
 
 ASSET_CACHE = {}
+EFFECT_VARIANT_CACHE = {}
 
 def load_all_assets():
     """Carga todas las animaciones del juego una sola vez al inicio."""
@@ -33,9 +34,61 @@ def load_all_assets():
             img = pygame.transform.scale(img, (180, 180))
             ASSET_CACHE['explosion'].append(img)
 
+    # Bullet image shared by every bullet, local or remote
+    get_bullet_image()
+
+    # Overlays shared by every tank
+    ASSET_CACHE['shield_effect'] = pygame.image.load("Assets/Effects/Shield/Shield.png").convert_alpha()
+    ASSET_CACHE['clock_effect'] = pygame.image.load("Assets/Effects/Clock/Clock_effect.png").convert_alpha()
+
     print("Assets cargados exitosamente.")
 
 
+def get_bullet_image():
+    """
+    Returns the bullet image shared by every bullet, loading it into ASSET_CACHE the first time.
+
+    Returns:
+        pygame.Surface: Pre-scaled bullet image.
+    """
+
+    image = ASSET_CACHE.get('bullet')
+    if image is None:
+        image = pygame.transform.scale(pygame.image.load('Assets/Entities/Bullet/bullet.png').convert_alpha(), (25, 25))
+        ASSET_CACHE['bullet'] = image
+    return image
+
+
+def get_effect_variant(frame, tints=(), overlay=None, alpha=255):
+    """
+    Returns an animation frame with power-up tints, an overlay and alpha applied.
+    Each combination is built once and shared, so callers must not modify the result.
+
+    Args:
+        frame (pygame.Surface): Source animation frame from ASSET_CACHE.
+        tints (tuple): RGB colors added to the frame with BLEND_RGB_ADD, in order.
+        overlay (pygame.Surface): Optional surface scaled to the frame size and blitted on top.
+        alpha (int): Surface alpha of the result.
+
+    Returns:
+        pygame.Surface: Cached variant of the frame.
+    """
+
+    key = (frame, tints, overlay, alpha)
+    variant = EFFECT_VARIANT_CACHE.get(key)
+
+    if variant is None:
+        variant = frame.copy()
+        for color in tints:
+            variant.fill(color, special_flags=pygame.BLEND_RGB_ADD)
+        if overlay is not None:
+            variant.blit(pygame.transform.scale(overlay, variant.get_size()), (0, 0))
+        variant.set_alpha(alpha)
+        EFFECT_VARIANT_CACHE[key] = variant
+
+    return variant
+
+
 def import_csv_layout(path):
     """
     Loads a CSV file and returns a 2D list representing the terrain map.
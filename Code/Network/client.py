@@ -12,6 +12,7 @@ class NetworkClient:
         self.message_handlers = {}
         self.receive_thread = None
         self.username = "Player"  # Añadir nombre de jugador
+        self.wake_handler = None  # llamado tras cada mensaje para despertar el bucle del juego
         
     def connect(self, host='0.0.0.0', port=5555, username="Player"):
         try:
@@ -174,6 +175,7 @@ class NetworkClient:
         
         self.connected = False
         print("Hilo de recepción terminado")
+        self.wake()
     
     def handle_message(self, message):
         message_type = message.get('type')
@@ -182,9 +184,21 @@ class NetworkClient:
             self.message_handlers[message_type](message)
         else:
             print(f"Tipo de mensaje no manejado: {message_type}")
+        self.wake()
     
     def register_handler(self, message_type: str, handler: Callable[[Any], None]):
         self.message_handlers[message_type] = handler
+
+    def set_wake_handler(self, handler: Callable[[], None]):
+        """Registra la función que despierta el bucle del juego cuando llega un mensaje"""
+        self.wake_handler = handler
+
+    def wake(self):
+        if self.wake_handler:
+            try:
+                self.wake_handler()
+            except Exception as e:
+                print(f"Error despertando el bucle del juego: {e}")
     
     def disconnect(self):
         self.connected = False
@@ -16,7 +16,11 @@ class Button():
         self.font = font
         self.base_color, self.hovering_color = base_color, hovering_color
         self.text_input = text_input
-        self.text = self.font.render(self.text_input, True, self.base_color)
+
+        # Both color states are rendered once and swapped on hover
+        self.base_text = self.font.render(self.text_input, True, self.base_color)
+        self.hovering_text = self.font.render(self.text_input, True, self.hovering_color)
+        self.text = self.base_text
         self.text_rect = self.text.get_rect(center=(self.x_pos, self.y_pos))
 
     def update(self, screen):
@@ -52,6 +56,7 @@ class Button():
         """
         
         if self.text_rect.collidepoint(position):
-            self.text = self.font.render(self.text_input, True, self.hovering_color)
+            self.text = self.hovering_text
         else:
-            self.text = self.font.render(self.text_input, True, self.base_color)
+            self.text = self.base_text
+
@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from Code.Utilities.settings import *
 
 class UI:
@@ -47,8 +48,107 @@ class UI:
         self.bar_height = 6
         self.margin = 10
 
+        # Retained HUD: outlined labels cached by text and style,
+        # panels re-composited only when their value changes
+        self.outline_offsets = [(-2,0),(2,0),(0,-2),(0,2), (-2,-2), (-2,2), (2,-2), (2,2)]
+        self.outline_width = 2
+        self.label_cache = OrderedDict()
+        self.panels = {}  # panel name -> (value, surface)
 
 
+
+    def render_outlined(self, text, color=(255, 255, 255), outline_color=(0, 0, 0)):
+        """
+        Returns the text rendered with its outline baked into a single surface.
+        Labels are cached by text and style, so each one is rendered only once.
+
+        Args:
+            text (str): Text to render.
+            color (tuple): RGB color of the text.
+            outline_color (tuple): RGB color of the outline.
+
+        Returns:
+            pygame.Surface: Outlined label, padded by the outline width on every side.
+        """
+
+        key = (text, color, outline_color)
+        label = self.label_cache.get(key)
+        if label is not None:
+            self.label_cache.move_to_end(key)
+            return label
+
+        text_surf = self.font.render(text, True, color)
+        border_surf = self.font.render(text, True, outline_color)
+        pad = self.outline_width
+
+        label = pygame.Surface((text_surf.get_width() + pad * 2, text_surf.get_height() + pad * 2), pygame.SRCALPHA)
+        for ox, oy in self.outline_offsets:
+            label.blit(border_surf, (pad + ox, pad + oy))
+        label.blit(text_surf, (pad, pad))
+
+        self.label_cache[key] = label
+        if len(self.label_cache) > HUD_LABEL_CACHE_SIZE:
+            self.label_cache.popitem(last=False)
+
+        return label
+
+    def get_panel(self, name, value, build):
+        """
+        Returns the cached surface of a HUD panel, rebuilding it only when its value changes.
+
+        Args:
+            name (str): Panel name.
+            value: Hashable value the panel displays.
+            build (callable): Function that receives the value and returns the panel surface.
+
+        Returns:
+            pygame.Surface: Panel surface.
+        """
+
+        cached = self.panels.get(name)
+        if cached is None or cached[0] != value:
+            cached = (value, build(value))
+            self.panels[name] = cached
+        return cached[1]
+
+    def blit_label(self, text, pos):
+        """
+        Blits a cached outlined label so its text starts at the given position.
+
+        Args:
+            text (str): Text to display.
+            pos (tuple): (x, y) position of the text.
+
+        Returns:
+            pygame.Surface: The label that was drawn.
+        """
+
+        label = self.render_outlined(text)
+        self.display_surface.blit(label, (pos[0] - self.outline_width, pos[1] - self.outline_width))
+        return label
+
+    def build_health_panel(self, value):
+        """
+        Composites the heart icons for the given health.
+
+        Args:
+            value (tuple): (current, max_amount) health values.
+
+        Returns:
+            pygame.Surface: Health panel.
+        """
+
+        current, max_amount = value
+        step = self.heart_rect.width + 1
+        panel = pygame.Surface((max(step * max_amount, 1), self.heart_rect.height), pygame.SRCALPHA)
+
+        for i in range(max_amount):
+            if i < current:
+                panel.blit(self.heart_image, (i * step, 0))
+            else:
+                panel.blit(self.empty_heart_image, (i * step, 0))
+        return panel
+
     def show_health(self, current, max_amount):
         """
         Displays the player's health as heart icons.
@@ -58,11 +158,8 @@ class UI:
             max_amount (int): Maximum health value.
         """
 
-        for i in range(max_amount):
-            if i < current:
-                self.display_surface.blit(self.heart_image, (self.heart_rect.x + i * (self.heart_rect.width + 1), self.heart_rect.y))
-            else:
-                self.display_surface.blit(self.empty_heart_image, (self.heart_rect.x + i * (self.heart_rect.width + 1), self.heart_rect.y))
+        panel = self.get_panel('health', (current, max_amount), self.build_health_panel)
+        self.display_surface.blit(panel, (self.heart_rect.x, self.heart_rect.y))
 
     def show_timer(self):
         """
@@ -76,17 +173,7 @@ class UI:
         seconds = elapsed_seconds % 60
         time_text = f"{minutes:02}:{seconds:02}"
 
-        # render of the prncipal text
-        text_surf = self.font.render(time_text, True, (255, 255, 255))
-        
-        # render of the border
-        border_surf = self.font.render(time_text, True, (0, 0, 0))
-        x, y = self.timer_pos
-        offsets = [(-2,0),(2,0),(0,-2),(0,2), (-2,-2), (-2,2), (2,-2), (2,2)]
-        for ox, oy in offsets:
-            self.display_surface.blit(border_surf, (x + ox, y + oy))
-        
-        self.display_surface.blit(text_surf, self.timer_pos)
+        self.blit_label(time_text, self.timer_pos)
 
     def show_difficulty(self, difficulty_name):
         """
@@ -96,18 +183,7 @@ class UI:
             difficulty_name (str): Name of the difficulty.
         """
 
-        difficulty_text = f"Difficulty: {difficulty_name}"  
-        text_surf = self.font.render(difficulty_text, True, (255, 255, 255))
-        
-        # render of the border
-        border_surf = self.font.render(difficulty_text, True, (0, 0, 0))
-        x, y = self.difficulty_pos
-
-        offsets = [(-2,0),(2,0),(0,-2),(0,2), (-2,-2), (-2,2), (2,-2), (2,2)]
-        for ox, oy in offsets:
-            self.display_surface.blit(border_surf, (x + ox, y + oy))
-        
-        self.display_surface.blit(text_surf, (x, y))
+        self.blit_label(f"Difficulty: {difficulty_name}", self.difficulty_pos)
 
     def show_rounds(self, total_rounds, current_round):
         """
@@ -118,18 +194,7 @@ class UI:
             current_round (int): Current round number.
         """
 
-        round_text = f"Wave {current_round} / {total_rounds}"  
-        text_surf = self.font.render(round_text, True, (255, 255, 255))
-        
-        # render of the border
-        border_surf = self.font.render(round_text, True, (0, 0, 0))
-        x, y = self.round_pos
-
-        offsets = [(-2,0),(2,0),(0,-2),(0,2), (-2,-2), (-2,2), (2,-2), (2,2)]
-        for ox, oy in offsets:
-            self.display_surface.blit(border_surf, (x + ox, y + oy))
-        
-        self.display_surface.blit(text_surf, (x, y))
+        self.blit_label(f"Wave {current_round} / {total_rounds}", self.round_pos)
 
     def show_next_wave_timer(self, duration=5):
         """
@@ -146,20 +211,40 @@ class UI:
         elapsed_seconds = elapsed_time_ms // 1000
 
         remaining = max(0, duration - elapsed_seconds)
-        wave_text = f"Next wave in: {remaining}"
+        label = self.render_outlined(f"Next wave in: {remaining}")
+
+        x = self.display_surface.get_width() // 2 - (label.get_width() - self.outline_width * 2) // 2
+        self.display_surface.blit(label, (x - self.outline_width, 250 - self.outline_width))
+
+        return remaining == 0
 
-        border_surf = self.font.render(wave_text, True, (0, 0, 0))
-        text_surf = self.font.render(wave_text, True, (255, 255, 255))
+    def build_powerups_panel(self, value):
+        """
+        Composites the icons and duration bars of the active power-ups.
 
-        x, y = (self.display_surface.get_width() // 2 - text_surf.get_width() // 2, 250)
+        Args:
+            value (tuple): ((icon_name, fill_width, y), ...) for each active power-up.
 
-        offsets = [(-2,0),(2,0),(0,-2),(0,2), (-2,-2), (-2,2), (2,-2), (2,2)]
-        for ox, oy in offsets:
-            self.display_surface.blit(border_surf, (x + ox, y + oy))
+        Returns:
+            pygame.Surface: Power-ups panel, anchored at its top-right corner.
+        """
 
-        self.display_surface.blit(text_surf, (x, y))
+        bar_height = 8
+        icon_w, icon_h = self.icon_size
+        height = max((y for _, _, y in value), default=0) + icon_h + 4 + bar_height
+        panel = pygame.Surface((icon_w, height), pygame.SRCALPHA)
 
-        return remaining == 0
+        for icon_name, fill_width, y in value:
+            panel.blit(self.powerup_icons[icon_name], (0, y))
+
+            # Barra debajo del ícono
+            background_rect = pygame.Rect(0, y + icon_h + 4, icon_w, bar_height)
+            health_rect = pygame.Rect(0, y + icon_h + 4, fill_width, bar_height)
+
+            pygame.draw.rect(panel, (0, 0, 0), background_rect)
+            pygame.draw.rect(panel, (0, 255, 0), health_rect)
+            pygame.draw.rect(panel, (0, 0, 0), background_rect, 2)
+        return panel
 
     def show_powerups(self, player):
         """
@@ -170,59 +255,50 @@ class UI:
         """
 
         current_time = pygame.time.get_ticks()
-        x = self.display_surface.get_width() - self.margin
-        y = self.margin
-        bar_height = 8
         spacing = 60
+        y = 0
+        active = []
 
-        def draw_bar(icon, remaining, total, pos_x, pos_y):
-
-            icon_rect = icon.get_rect(topright=(pos_x, pos_y))
-            self.display_surface.blit(icon, icon_rect)
-
-            # Barra debajo del ícono
-            bar_width = icon_rect.width
-
+        def add_bar(icon_name, remaining, total, pos_y):
             fill_ratio = max(0, min(1, remaining / total))
-
-            background_rect = pygame.Rect(icon_rect.left, icon_rect.bottom + 4, bar_width, bar_height)
-            health_rect = pygame.Rect(icon_rect.left, icon_rect.bottom + 4, int(bar_width * fill_ratio), bar_height)
-
-            pygame.draw.rect(self.display_surface, (0, 0, 0), background_rect)
-            pygame.draw.rect(self.display_surface, (0, 255, 0), health_rect)
-            pygame.draw.rect(self.display_surface, (0, 0, 0), background_rect, 2)
+            active.append((icon_name, int(self.icon_size[0] * fill_ratio), pos_y))
 
         # Shield
         if player.shield_active:
             total = player.shield_duration
             remaining = max(0, (player.shield_end_time - current_time))
-            draw_bar(self.powerup_icons["shield"], remaining, total, x, y)
+            add_bar("shield", remaining, total, y)
             y += spacing
 
         # Weapon upgrade
         if player.shoot_upgrade_active:
             total = player.shoot_upgrade_duration
             remaining = max(0, (player.shoot_upgrade_end - current_time))
-            draw_bar(self.powerup_icons["weapon"], remaining, total, x, y)
+            add_bar("weapon", remaining, total, y)
             y += spacing
 
         # Slow motion
         if player.slow_motion_active:
             total = player.slow_motion_duration
             remaining = max(0, (player.slow_motion_end - current_time))
-            draw_bar(self.powerup_icons["slow"], remaining, total, x, y)
+            add_bar("slow", remaining, total, y)
 
         # Machine gun
         if player.machine_gun_active:
             total = player.machine_gun_duration
             remaining = max(0, (player.machine_gun_end - current_time))
-            draw_bar(self.powerup_icons["machine_gun"], remaining, total, x, y)
+            add_bar("machine_gun", remaining, total, y)
 
         # Fortress shield
         if player.fortress_shield_active:
             total = player.fortress_shield_duration
             remaining = max(0, (player.fortress_shield_end - current_time))
-            draw_bar(self.powerup_icons["fortress_shield"], remaining, total, x, y)
+            add_bar("fortress_shield", remaining, total, y)
+
+        if active:
+            panel = self.get_panel('powerups', tuple(active), self.build_powerups_panel)
+            x = self.display_surface.get_width() - self.margin - panel.get_width()
+            self.display_surface.blit(panel, (x, self.margin))
             
     def display(self, player, difficulty_name, total_rounds, current_round):
         """
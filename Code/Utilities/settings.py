@@ -3,6 +3,13 @@ WIDTH    = 1280
 HEIGTH   = 720
 FPS      = 60
 TILESIZE = 64
+MAP_COLS = 64  # size of the CSV layouts in Assets/Map_matrix
+MAP_ROWS = 64
+WORLD_RECT = (0, 0, MAP_COLS * TILESIZE, MAP_ROWS * TILESIZE)  # x, y, width, height in pixels
+
+# menus block on the event queue instead of ticking at FPS
+IDLE_STATES = ('menu', 'choose', 'multiplayer_menu', 'join_game', 'lobby', 'multiplayer_difficulty', 'select_difficulty', 'settings', 'end')
+IDLE_EVENT_TIMEOUT = 500  # ms
 
 # ui
 BAR_HEIGHT = 20
@@ -10,6 +17,8 @@ HEALTH_BAR_WIDTH = 200
 ITEM_BOX_SIZE = 80
 UI_FONT = "Assets/Fonts/joystix.ttf"
 UI_FONTSIZE = 25
+HUD_LABEL_CACHE_SIZE = 64
+MENU_TEXT_CACHE_SIZE = 128
 
 # enemies
 tanks_data =  {
@@ -38,4 +47,56 @@ bonus_data =  {
 # structures
 estructure_data =  {
    'fortress':{'health': 5},
-}
\ No newline at end of file
+}
+
+# collisions
+COLLISION_MODE = 'grid'  # 'grid' looks up the tile grid, 'sprites' queries the obstacle spatial hash
+
+# bullets
+BULLET_MAX_RANGE = 2048  # px travelled before a bullet that hit nothing is removed
+BULLET_POOL_SIZE = 64     # bullets created up front by Level's BulletPool
+BULLET_ENGINE = 'sprites'  # 'sprites' or 'numpy' (optional dependency, for stress modes)
+BULLET_ENGINE_CAPACITY = 1024  # initial slots of the NumPy engine, doubled when full
+
+# pathfinding
+PATHFINDING_ENGINE = 'grid'  # 'grid' (array-backed A*) or 'matrix' (a_star over the string matrix)
+FORTRESS_FLOW_FIELD = True   # enemies heading to the fortress follow a shared flow field instead of A*
+PLAYER_FLOW_FIELDS = True    # chasing enemies follow a distance field rooted at the player's cell
+# Per-enemy A* (Enemy.request_path) only runs for the targets whose flow field is disabled above.
+# The path cache and the worker pool serve those requests, so with both flags True they stay idle
+# (the pool is started on the first A* request, never at startup).
+PATH_CACHE_SIZE = 256        # A* results kept by PathRequest (LRU)
+PATHFINDING_WORKERS = 2      # processes for asynchronous A* requests (0 = synchronous)
+
+# line of sight
+LOS_CACHE_SIZE = 8192  # cached (enemy cell, target cell) rays before the cache is reset
+
+# collision layers: each sprite has a category bit, bullets a mask of the categories they hit
+LAYER_PLAYER = 1 << 0
+LAYER_ENEMY = 1 << 1
+LAYER_STRUCTURE = 1 << 2
+LAYER_BREAKABLE = 1 << 3  # grass, walls
+LAYER_SOLID = 1 << 4      # rocks, barrier
+
+COLLISION_LAYERS = {
+    'player': LAYER_PLAYER,
+    'enemy': LAYER_ENEMY,
+    'structure': LAYER_STRUCTURE,
+    'grass': LAYER_BREAKABLE,
+    'walls': LAYER_BREAKABLE,
+    'rocks': LAYER_SOLID,
+    'barrier': LAYER_SOLID,
+}
+
+# Friendly fire rules: bullets pass through tanks of their own side
+BULLET_MASKS = {
+    'player': LAYER_ENEMY | LAYER_BREAKABLE | LAYER_SOLID,
+    'enemy': LAYER_PLAYER | LAYER_STRUCTURE | LAYER_BREAKABLE | LAYER_SOLID,
+}
+
+# camera
+SCALED_SURFACE_CACHE_SIZE = 512
+STATIC_CHUNK_TILES = 8
+BAKED_TILE_TYPES = ('rocks', 'walls', 'grass')
+STATIC_SPRITE_TYPES = ('rocks', 'walls', 'grass', 'invisible', 'barrier', 'structure')
+RENDER_MODE = 'scaled_sprites'  # 'scaled_sprites' or 'viewport'
@@ -1,5 +1,6 @@
 import pygame, sys
 import time
+from collections import OrderedDict
 from Code.Utilities.settings import *
 from Code.UI.button import Button
 from Code.Classes.level import Level
@@ -30,7 +31,13 @@ class Game:
         self.state = 'menu'  # 'menu', 'choose', 'play', 'end', 'multiplayer_menu', 'create_join', 'lobby', 'settings', 'multiplayer_difficulty'
         self.win = False  
         
-        self.font = pygame.font.Font(UI_FONT, 45)
+        # Fonts and outlined texts are cached, menus only redraw when their contents change
+        self.fonts = {}
+        self.text_cache = OrderedDict()
+        self.button_cache = {}
+        self.menu_signature = None
+
+        self.font = self.get_font(45)
 
         # Main menu buttons
         self.play_button = Button(pos=(200, 400), 
@@ -95,11 +102,15 @@ class Game:
                             text_input="BACK", font=self.get_font(55), base_color="black", hovering_color="White")
 
         self.bg_image = pygame.image.load("Assets/Map_tiles/MapaJuego.png")
-        self.bg_image = pygame.transform.scale(self.bg_image, (WIDTH + 50, HEIGTH + 50))
+        self.bg_image = pygame.transform.scale(self.bg_image, (WIDTH + 50, HEIGTH + 50)).convert()
 
         self.level = None
         self.difficulty = None
         self.network_client = NetworkClient()
+
+        # Network messages wake the loop while it is idling in a menu
+        self.network_event = pygame.event.custom_type()
+        self.network_client.set_wake_handler(lambda: pygame.event.post(pygame.event.Event(self.network_event)))
         self.game_code = ""
         self.input_active = False
         self.players_connected = 1
@@ -124,24 +135,57 @@ class Game:
     def get_font(self, size):
         """
         Return a Pygame font object of the specified size using the predefined UI font.
+        Fonts are created once per size and reused.
         """
-        return pygame.font.Font(UI_FONT, size)
+        if size not in self.fonts:
+            self.fonts[size] = pygame.font.Font(UI_FONT, size)
+        return self.fonts[size]
 
-    def draw_text_with_outline(self, surface, text, font, color, outline_color, pos, outline_width=3):
+    def get_outlined_text(self, text, font, color, outline_color, outline_width):
         """
-        Draws text with an outline on the given surface at the specified position.
+        Returns the text pre-baked with its outline into a single surface, padded by the outline width.
+        Results are cached by text, font and style.
         """
+        key = (text, font, color, outline_color, outline_width)
+        outlined = self.text_cache.get(key)
+        if outlined is not None:
+            self.text_cache.move_to_end(key)
+            return outlined
+
         text_surf = font.render(text, True, color)
         outline_surf = font.render(text, True, outline_color)
-        text_rect = text_surf.get_rect(center=pos)
+        outlined = pygame.Surface((text_surf.get_width() + outline_width * 2,
+                                   text_surf.get_height() + outline_width * 2), pygame.SRCALPHA)
 
         for offset_x in range(-outline_width, outline_width + 1):
             for offset_y in range(-outline_width, outline_width + 1):
                 if offset_x**2 + offset_y**2 <= outline_width**2:
                     if offset_x != 0 or offset_y != 0:
-                        surface.blit(outline_surf, text_rect.move(offset_x, offset_y))
+                        outlined.blit(outline_surf, (outline_width + offset_x, outline_width + offset_y))
 
-        surface.blit(text_surf, text_rect)
+        outlined.blit(text_surf, (outline_width, outline_width))
+
+        self.text_cache[key] = outlined
+        if len(self.text_cache) > MENU_TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return outlined
+
+    def draw_text_with_outline(self, surface, text, font, color, outline_color, pos, outline_width=3):
+        """
+        Draws text with an outline on the given surface at the specified position.
+        """
+        outlined = self.get_outlined_text(text, font, color, outline_color, outline_width)
+        surface.blit(outlined, outlined.get_rect(center=pos))
+
+    def get_cached_button(self, pos, text_input, hovering_color):
+        """
+        Returns a menu button for the given text and hover color, creating it only the first time.
+        """
+        key = (pos, text_input, hovering_color)
+        if key not in self.button_cache:
+            self.button_cache[key] = Button(pos=pos, text_input=text_input, font=self.get_font(55),
+                                            base_color="black", hovering_color=hovering_color)
+        return self.button_cache[key]
 
     def draw_text_input(self, surface, prompt, text, font, color, pos, max_width=300):
         """
@@ -296,15 +340,6 @@ class Game:
     def lobby_menu(self):
         self.screen.blit(self.bg_image, (0, 0))
         menu_mouse_pos = pygame.mouse.get_pos()
-        
-        current_time = pygame.time.get_ticks()
-        if not hasattr(self, 'last_ping_time'):
-            self.last_ping_time = current_time
-        
-        if current_time - self.last_ping_time > 5000:
-            if self.network_client.connected:
-                self.network_client.send_message({'command': 'ping'})
-                self.last_ping_time = current_time
 
         self.draw_text_with_outline(self.screen, "LOBBY", self.get_font(100), "black", "white", (640, 200), outline_width=5)
         self.draw_text_with_outline(self.screen, f"Game Code: {self.game_code}", self.get_font(40), "black", "white", (640, 280), outline_width=3)
@@ -319,10 +354,8 @@ class Game:
             self.draw_text_with_outline(self.screen, "Role: HOST", self.get_font(30), "green", "white", (640, 470), outline_width=2)
         
             start_text = "START GAME" if self.players_connected == 2 else "WAITING FOR PLAYER..."
-            self.start_game_button = Button(pos=(640, 550), 
-                                        text_input=start_text, font=self.get_font(55), 
-                                        base_color="black", 
-                                        hovering_color="Green" if self.players_connected == 2 else "Gray")
+            self.start_game_button = self.get_cached_button((640, 550), start_text,
+                                        "Green" if self.players_connected == 2 else "Gray")
             self.start_game_button.changeColor(menu_mouse_pos)
             self.start_game_button.update(self.screen)
         
@@ -331,9 +364,7 @@ class Game:
         
             if self.players_connected == 2:
                 ready_text = "READY"
-                self.ready_button = Button(pos=(640, 550), 
-                                        text_input=ready_text, font=self.get_font(55), 
-                                        base_color="black", hovering_color="Green")
+                self.ready_button = self.get_cached_button((640, 550), ready_text, "Green")
                 self.ready_button.changeColor(menu_mouse_pos)
                 self.ready_button.update(self.screen)
             else:
@@ -342,6 +373,20 @@ class Game:
         self.lobby_back_button.changeColor(menu_mouse_pos)
         self.lobby_back_button.update(self.screen)
 
+    def send_lobby_ping(self):
+        """
+        Keeps the lobby connection alive by pinging the server every 5 seconds.
+        Runs every loop, even when the lobby screen is not redrawn.
+        """
+        current_time = pygame.time.get_ticks()
+        if not hasattr(self, 'last_ping_time'):
+            self.last_ping_time = current_time
+        
+        if current_time - self.last_ping_time > 5000:
+            if self.network_client.connected:
+                self.network_client.send_message({'command': 'ping'})
+                self.last_ping_time = current_time
+
     def multiplayer_difficulty_menu(self):
         """Menú para que el host elija la dificultad en multiplayer"""
         self.screen.blit(self.bg_image, (0, 0))
@@ -476,13 +521,6 @@ class Game:
         """
         self.screen.blit(self.bg_image, (0, 0))
         menu_mouse_pos = pygame.mouse.get_pos()
-        
-        difficulties = { 
-            "easy": {"name": "Easy", "enemyTankType1": 20, "enemyTankType2": 20, "enemyTankType3": 10, "enemyTankType4": 5}, 
-            "medium": {"name": "Medium", "enemyTankType1": 10, "enemyTankType2": 10, "enemyTankType3": 15, "enemyTankType4": 10}, 
-            "hard": {"name": "Hard", "enemyTankType1": 10, "enemyTankType2": 10, "enemyTankType3": 20, "enemyTankType4": 20}, 
-            "nightmare": {"name": "Nightmare", "enemyTankType4": 40, "enemyTankType5": 10} 
-        }
 
         for button in [
             self.choose_easy_mode_button,
@@ -493,23 +531,30 @@ class Game:
             button.changeColor(menu_mouse_pos)
             button.update(self.screen)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.choose_easy_mode_button.checkForInput(menu_mouse_pos):
-                    self.difficulty = difficulties["easy"]
-                    self.state = 'play'
-                elif self.choose_medium_mode_button.checkForInput(menu_mouse_pos):
-                    self.difficulty = difficulties["medium"]
-                    self.state = 'play'
-                elif self.choose_hard_mode_button.checkForInput(menu_mouse_pos):
-                    self.difficulty = difficulties["hard"]
-                    self.state = 'play'
-                elif self.choose_nightmare_mode_button.checkForInput(menu_mouse_pos):
-                    self.difficulty = difficulties["nightmare"]
-                    self.state = 'play'
+    def handle_difficulty_click(self, event, menu_mouse_pos):
+        """
+        Handles difficulty selection clicks on the single player difficulty menu.
+        """
+        difficulties = { 
+            "easy": {"name": "Easy", "enemyTankType1": 20, "enemyTankType2": 20, "enemyTankType3": 10, "enemyTankType4": 5}, 
+            "medium": {"name": "Medium", "enemyTankType1": 10, "enemyTankType2": 10, "enemyTankType3": 15, "enemyTankType4": 10}, 
+            "hard": {"name": "Hard", "enemyTankType1": 10, "enemyTankType2": 10, "enemyTankType3": 20, "enemyTankType4": 20}, 
+            "nightmare": {"name": "Nightmare", "enemyTankType4": 40, "enemyTankType5": 10} 
+        }
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.choose_easy_mode_button.checkForInput(menu_mouse_pos):
+                self.difficulty = difficulties["easy"]
+                self.state = 'play'
+            elif self.choose_medium_mode_button.checkForInput(menu_mouse_pos):
+                self.difficulty = difficulties["medium"]
+                self.state = 'play'
+            elif self.choose_hard_mode_button.checkForInput(menu_mouse_pos):
+                self.difficulty = difficulties["hard"]
+                self.state = 'play'
+            elif self.choose_nightmare_mode_button.checkForInput(menu_mouse_pos):
+                self.difficulty = difficulties["nightmare"]
+                self.state = 'play'
 
     def play(self):
         try:
@@ -600,11 +645,30 @@ class Game:
                     if len(self.username_input) < 15:
                         self.username_input += event.unicode
     
-    def check_events(self):
+    def wait_for_events(self):
+        """
+        Returns the pending events, blocking until at least one arrives in idle menu states.
+        The wait times out after IDLE_EVENT_TIMEOUT ms so timed work like lobby pings still runs.
+        """
+        if self.state not in IDLE_STATES:
+            return pygame.event.get()
+
+        event = pygame.event.wait(IDLE_EVENT_TIMEOUT)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def check_events(self, events=None):
         """
         Processes all Pygame events, updates game state, and handles button clicks for all menus.
+
+        Args:
+            events (list, optional): Events to process. Defaults to the pending event queue.
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+
+        for event in events:
             if event.type == pygame.QUIT:
                 if self.network_client.connected:
                     self.network_client.disconnect()
@@ -637,6 +701,9 @@ class Game:
                     elif self.choose_mode_multiplayer_button.checkForInput(mouse_pos):
                         self.state = 'multiplayer_menu'
                         
+                elif self.state == 'select_difficulty':
+                    self.handle_difficulty_click(event, mouse_pos)
+
                 elif self.state == 'multiplayer_menu':
                     if self.create_game_button.checkForInput(mouse_pos):
                         self.state = 'create_game'
@@ -738,37 +805,102 @@ class Game:
                         pygame.quit()
                         sys.exit()
     
+    def get_menu_buttons(self):
+        """
+        Returns the buttons shown on the current menu screen.
+        """
+        if self.state == 'lobby':
+            if self.is_host:
+                return [self.start_game_button, self.lobby_back_button]
+            if self.players_connected == 2:
+                return [self.ready_button, self.lobby_back_button]
+            return [self.lobby_back_button]
+
+        return {
+            'menu': [self.play_button, self.quit_button, self.settings_button],
+            'choose': [self.choose_mode_one_player_button, self.choose_mode_multiplayer_button],
+            'multiplayer_menu': [self.create_game_button, self.join_game_button, self.back_button],
+            'create_game': [self.back_button],
+            'join_game': [self.join_game_button, self.back_button],
+            'multiplayer_difficulty': [self.multiplayer_easy_button, self.multiplayer_medium_button,
+                                       self.multiplayer_hard_button, self.multiplayer_back_button],
+            'select_difficulty': [self.choose_easy_mode_button, self.choose_medium_mode_button,
+                                  self.choose_hard_mode_button, self.choose_nightmare_mode_button],
+            'settings': [self.save_settings_button, self.settings_back_button],
+            'end': [self.restart_button, self.quit_end_button],
+        }.get(self.state, [])
+
+    def get_menu_signature(self):
+        """
+        Returns everything the current menu screen depends on, except the hover state.
+        The menu is only redrawn when this or the hovered buttons change.
+        """
+        return (self.state, self.win, self.game_code, self.players_connected, self.is_host,
+                self.network_client.connected, self.server_ip, self.username_input,
+                self.server_ip_input, self.ip_input_active, self.username_input_active)
+
+    def draw_menu(self):
+        """
+        Redraws the current menu screen only when its contents or hovered buttons changed,
+        and updates only the button rectangles when just the hover state changed.
+        """
+        menu_screens = {
+            'menu': self.main_menu,
+            'choose': self.play_menu,
+            'multiplayer_menu': self.multiplayer_menu,
+            'create_game': self.create_game_menu,
+            'join_game': self.join_game_menu,
+            'lobby': self.lobby_menu,
+            'multiplayer_difficulty': self.multiplayer_difficulty_menu,
+            'select_difficulty': self.select_difficulty_menu,
+            'settings': self.settings_menu,
+            'end': self.end_menu,
+        }
+        if self.state not in menu_screens:
+            return
+
+        # The create game screen connects to the server while it is drawn
+        if self.state == 'create_game':
+            self.create_game_menu()
+            self.menu_signature = None
+            pygame.display.update()
+            return
+
+        mouse_pos = pygame.mouse.get_pos()
+        buttons = self.get_menu_buttons()
+        hovered = tuple(button.checkForInput(mouse_pos) for button in buttons)
+        signature = self.get_menu_signature()
+
+        previous = self.menu_signature
+        if previous == (signature, buttons, hovered):
+            return
+
+        menu_screens[self.state]()
+        self.menu_signature = (signature, buttons, hovered)
+
+        if previous and previous[0] == signature and previous[1] == buttons:
+            dirty_rects = [button.text_rect for button, was_hovered, is_hovered
+                           in zip(buttons, previous[2], hovered) if was_hovered != is_hovered]
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.update()
+
     def run(self):
         """
         Main game loop. Continuously checks events, updates the current menu or game state, and refreshes the display.
         """
         while True:
-            self.check_events()
+            self.check_events(self.wait_for_events())
             
-            if self.state == 'menu':
-                self.main_menu()
-            elif self.state == 'choose':
-                self.play_menu()
-            elif self.state == 'multiplayer_menu':
-                self.multiplayer_menu()
-            elif self.state == 'create_game':
-                self.create_game_menu()
-            elif self.state == 'join_game':
-                self.join_game_menu()
-            elif self.state == 'lobby':
-                self.lobby_menu()
-            elif self.state == 'multiplayer_difficulty':
-                self.multiplayer_difficulty_menu()
-            elif self.state == 'select_difficulty':
-                self.select_difficulty_menu()
-            elif self.state == 'settings':
-                self.settings_menu()
-            elif self.state == 'end':     
-                self.end_menu()
-            elif self.state == 'play':
+            if self.state == 'play':
                 self.play()
+                self.menu_signature = None
+                pygame.display.update()
+            else:
+                if self.state == 'lobby':
+                    self.send_lobby_ping()
+                self.draw_menu()
 
-            pygame.display.update()
             self.clock.tick(FPS)
 
 if __name__ == '__main__':